@@ -3,21 +3,237 @@ Streamlit Adapter Module
 
 This module adapts the core LanceDB services and components to the Streamlit UI framework.
 """
+import threading
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import pandas as pd
-from typing import Optional, Dict, Any
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+from typing import Optional, Dict, Any, List
 from services.lancedb_service import LanceDBService
-from services.embedding_service import EmbeddingService
-from services.semantic_search_service import SemanticSearchService
 from services.table_operations_service import TableOperationsService
 from utils.error_utils import handle_error, AppError
 from utils.env_utils import is_running_in_docker, get_default_db_path
+from utils.schema_utils import is_vector_field
 import logging
 
 # Configure logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# The environment doesn't change between reruns, so resolve it once at import
+_IN_DOCKER = is_running_in_docker()
+_DEFAULT_DB_PATH = get_default_db_path()
+
+# Session state set up on a session's first run
+_SESSION_DEFAULTS = {
+    'lancedb_connected': False,
+    'lancedb_db_path': None,
+    'lancedb_tables': [],
+    'current_table': None,
+    'data': None,
+    'error': None
+}
+
+@st.cache_resource(show_spinner=False)
+def get_db_service(db_path: str) -> LanceDBService:
+    """
+    Get a connected LanceDB service, shared across reruns and sessions.
+    
+    Args:
+        db_path: Path to the LanceDB database
+        
+    Returns:
+        Connected LanceDBService instance
+        
+    Raises:
+        ConnectionError: If connection fails (failures are not cached)
+    """
+    service = LanceDBService()
+    service.connect(db_path)
+    return service
+
+@st.cache_resource(show_spinner=False)
+def _get_embedding_service():
+    """
+    Get the embedding service, shared across reruns and sessions.
+    The service module is only imported on first use.
+    
+    Returns:
+        EmbeddingService instance
+    """
+    from services.embedding_service import EmbeddingService
+    return EmbeddingService()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_models() -> Dict[str, Dict[str, Any]]:
+    """
+    Get the available embedding models, reusing the result across reruns.
+    
+    Returns:
+        Dictionary of model information
+    """
+    return _get_embedding_service().get_available_models()
+
+@st.cache_data(ttl=600, max_entries=256, show_spinner=False)
+def _encode(model_name: str, query: str) -> np.ndarray:
+    """
+    Encode a search query, reusing the vector across reruns.
+    Changing only the table or result limit then skips the model entirely.
+    
+    Args:
+        model_name: Model to use for embedding generation
+        query: Text to encode
+        
+    Returns:
+        Query vector
+    """
+    vector = _get_embedding_service().generate_embedding(query, model_name)
+    return np.asarray(vector, dtype=np.float32)
+
+@st.cache_resource(show_spinner=False)
+def _get_semantic_search(db_path: str, _db_service: LanceDBService):
+    """
+    Get the semantic search service for a database.
+    The service module is only imported on first use.
+    
+    Args:
+        db_path: Database path, used as the cache key
+        _db_service: Connected database service (not hashed)
+        
+    Returns:
+        SemanticSearchService instance
+    """
+    from services.semantic_search_service import SemanticSearchService
+    return SemanticSearchService(
+        db_service=_db_service,
+        embedding_service=_get_embedding_service()
+    )
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_list_tables(db_path: str, _table_ops: TableOperationsService) -> List[str]:
+    """
+    List the tables of a database, reusing the result across reruns.
+    
+    Args:
+        db_path: Database path, used as the cache key
+        _table_ops: Table operations service (not hashed)
+        
+    Returns:
+        List of table names
+    """
+    result = _table_ops.list_tables()
+    if not result['success']:
+        raise AppError(result['error']['message'])
+    return result['data']
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_embedding_tables(db_path: str, _semantic_search) -> List[tuple]:
+    """
+    List the tables with embedding columns, reusing the result across reruns.
+    
+    Args:
+        db_path: Database path, used as the cache key
+        _semantic_search: Semantic search service (not hashed)
+        
+    Returns:
+        List of tuples (table_name, embedding_column)
+    """
+    result = _semantic_search.get_embedding_tables()
+    if not result['success']:
+        raise AppError(result['error']['message'])
+    return result['data']
+
+@st.cache_data(ttl=600, max_entries=64, show_spinner=False)
+def _cached_table_description(db_path: str, table_name: str, version: int,
+                              _table_ops: TableOperationsService) -> Dict[str, Any]:
+    """
+    Describe a table, reusing the description until the table changes.
+    
+    Args:
+        db_path: Database path, used as the cache key
+        table_name: Table to describe
+        version: Table version, so writes invalidate the entry
+        _table_ops: Table operations service (not hashed)
+        
+    Returns:
+        Dictionary with the table description
+    """
+    result = _table_ops.describe_table(table_name)
+    if not result['success']:
+        raise AppError(result['error']['message'])
+    return result['data']
+
+@st.cache_data(ttl=600, max_entries=64, show_spinner=False)
+def _cached_table_data(db_path: str, table_name: str, limit: int, offset: int,
+                       include_vectors: bool, version: int,
+                       _table_ops: TableOperationsService) -> pa.Table:
+    """
+    Read a window of table rows, reusing it until the table changes.
+    
+    Args:
+        db_path: Database path, used as the cache key
+        table_name: Table to query
+        limit: Maximum number of rows
+        offset: Number of rows to skip
+        include_vectors: Whether to read vector columns too
+        version: Table version, so writes invalidate the entry
+        _table_ops: Table operations service (not hashed)
+        
+    Returns:
+        Arrow table with the rows
+    """
+    result = _table_ops.get_table_data(
+        table_name, limit, offset=offset, include_vectors=include_vectors
+    )
+    if not result['success']:
+        raise AppError(result['error']['message'])
+    return result['data']['data']
+
+def _selected_rows(preview: pa.Table, edited: pa.Table) -> pa.Table:
+    """
+    Get the preview rows ticked in the editor's Select column.
+    
+    The editor round-trips its data through pandas, which turns nullable
+    integers into floats and NaN into null. Only the checkbox is read from
+    it, so the rows keep the table's own types and values.
+    
+    Args:
+        preview: Rows shown in the editor, without the Select column
+        edited: Data returned by the editor
+        
+    Returns:
+        Arrow table with the selected preview rows
+    """
+    mask = pc.fill_null(edited.column("Select"), False)
+    return preview.filter(mask)
+
+def _prefetch_table_data(*args) -> None:
+    """Warm _cached_table_data from a background thread, ignoring failures."""
+    try:
+        _cached_table_data(*args)
+    except Exception as e:
+        # The page is read again (and the error shown) if it is opened
+        logger.debug(f"Prefetch failed: {str(e)}")
+
+def _truncate_vectors(data: pa.Table, dims: int = 8) -> pa.Table:
+    """
+    Truncate vector columns to their first dimensions for display.
+    
+    Args:
+        data: Arrow table to display
+        dims: Number of dimensions to keep
+        
+    Returns:
+        Arrow table with truncated vector columns
+    """
+    for i, field in enumerate(data.schema):
+        if is_vector_field(field):
+            truncated = pc.list_slice(data.column(i), 0, dims, return_fixed_size_list=False)
+            data = data.set_column(i, field.name, truncated)
+    return data
+
 class StreamlitLanceDBAdapter:
     """
     Adapter class that connects LanceDB services with Streamlit UI.
@@ -30,38 +246,36 @@ class StreamlitLanceDBAdapter:
         
     def _initialize_services(self):
         """Initialize service instances."""
-        # Create or retrieve services from session state
-        if 'lancedb_service' not in st.session_state:
-            st.session_state.lancedb_service = LanceDBService()
-        if 'embedding_service' not in st.session_state:
-            st.session_state.embedding_service = EmbeddingService()
-            
-        self.db_service = st.session_state.lancedb_service
-        self.embedding_service = st.session_state.embedding_service
+        # The database service is a shared resource once a path is known
+        db_path = st.session_state.get('lancedb_db_path')
+        self.db_service = get_db_service(db_path) if db_path else LanceDBService()
+        self._initialize_dependent_services()
         
-        # Initialize dependent services
-        self.semantic_search = SemanticSearchService(
-            db_service=self.db_service,
-            embedding_service=self.embedding_service
-        )
-        self.table_ops = TableOperationsService(
-            db_service=self.db_service,
-            embedding_service=self.embedding_service
-        )
+    def _initialize_dependent_services(self):
+        """Initialize services that depend on the database service."""
+        self.table_ops = TableOperationsService(db_service=self.db_service)
+    
+    @property
+    def embedding_service(self):
+        """Embedding service, created on first use."""
+        return _get_embedding_service()
+    
+    @property
+    def semantic_search(self):
+        """Semantic search service, created on first use."""
+        return _get_semantic_search(self.db_service.db_path, self.db_service)
         
     def _initialize_session_state(self):
-        """Initialize Streamlit session state variables."""
-        defaults = {
-            'lancedb_connected': False,
-            'lancedb_tables': [],
-            'current_table': None,
-            'data': None,
-            'error': None
-        }
-        
-        for key, value in defaults.items():
-            if key not in st.session_state:
-                st.session_state[key] = value
+        """
+        Initialize Streamlit session state variables.
+        Runs once per session; later reruns only check the sentinel key.
+        """
+        if '_lancedb_initialized' in st.session_state:
+            return
+        
+        for key, value in _SESSION_DEFAULTS.items():
+            st.session_state.setdefault(key, value)
+        st.session_state['_lancedb_initialized'] = True
     
     def _handle_error(self, error: Exception) -> None:
         """Handle and display errors in the UI."""
@@ -74,65 +288,123 @@ class StreamlitLanceDBAdapter:
                 st.json(error_data['error']['details'])
         else:
             st.error(f"Unexpected error: {error_msg}")
-            logger.error("Unexpected error", exc_info=True)
+            # A persistent failure repeats on every rerun, only log it once
+            signature = (type(error).__name__, error_msg[:128])
+            if st.session_state.get('_last_error_signature') != signature:
+                st.session_state['_last_error_signature'] = signature
+                logger.error(f"Unexpected error: {error_msg}", exc_info=True)
     
     def handle_connection(self):
         """Handle database connection in the UI."""
         try:
-            # Auto-connect in Docker environment
-            if is_running_in_docker() and not st.session_state.lancedb_connected:
+            # Auto-connect in Docker environment, once per session
+            if _IN_DOCKER and not st.session_state.lancedb_connected \
+                    and not st.session_state.get('_docker_connect_attempted'):
+                st.session_state['_docker_connect_attempted'] = True
                 self._handle_docker_connection()
                 
             # Show connection panel if needed
             if not st.session_state.lancedb_connected:
                 with st.expander("LanceDB Connection", expanded=True):
                     self._display_connection_form()
+            else:
+                self._display_connection_status()
                     
         except Exception as e:
             self._handle_error(e)
     
+    def _display_connection_status(self):
+        """Display the active connection with a button to reconnect."""
+        db_path = st.session_state.lancedb_db_path
+        with st.sidebar:
+            st.caption(f"Connected to `{db_path}`")
+            if st.button("Reconnect"):
+                self._reconnect(db_path)
+    
+    def _reconnect(self, db_path: str):
+        """
+        Drop the shared connection and everything cached on it, then connect again.
+        
+        Args:
+            db_path: Path to the LanceDB database
+        """
+        get_db_service.clear()
+        _get_semantic_search.clear()
+        self._invalidate_table_description()
+        with st.spinner(f"Reconnecting to {db_path}..."):
+            self._connect(db_path, refresh=True)
+    
     def _handle_docker_connection(self):
-        """Handle automatic connection in Docker environment."""
-        host_db_path = get_default_db_path()
+        """
+        Handle automatic connection in Docker environment.
+        A failure is reported once and falls back to the connection form.
+        """
+        host_db_path = _DEFAULT_DB_PATH
         if host_db_path:
             with st.spinner(f"Connecting to database at {host_db_path}..."):
-                if self.db_service.connect(host_db_path):
-                    st.session_state.lancedb_connected = True
-                    self._refresh_table_list()
+                try:
+                    self._connect(host_db_path)
                     st.success(f"Connected to LanceDB at {host_db_path}")
+                except Exception as e:
+                    self._handle_error(e)
+    
+    def _connect(self, db_path: str, refresh: bool = False):
+        """
+        Connect to a database and bind the services to the shared connection.
+        
+        Args:
+            db_path: Path to the LanceDB database
+            refresh: Drop the cached table lists instead of reusing them
+        """
+        self.db_service = get_db_service(db_path)
+        self._initialize_dependent_services()
+        st.session_state.lancedb_db_path = db_path
+        st.session_state.lancedb_connected = True
+        self._refresh_table_list(force=refresh)
     
     def _display_connection_form(self):
         """Display the connection form in the UI."""
-        db_path = st.text_input(
-            "LanceDB Path",
-            value=get_default_db_path(),
-            placeholder="/path/to/lancedb"
-        )
+        # A form only reruns the script on submit, not on every keystroke
+        with st.form("connection_form"):
+            db_path = st.text_input(
+                "LanceDB Path",
+                value=_DEFAULT_DB_PATH,
+                placeholder="/path/to/lancedb"
+            )
+            submitted = st.form_submit_button("Connect")
         
-        if st.button("Connect"):
+        if submitted:
             with st.spinner("Connecting to LanceDB..."):
                 try:
-                    if self.db_service.connect(db_path):
-                        st.session_state.lancedb_connected = True
-                        self._refresh_table_list()
-                        st.success(f"Connected to LanceDB at {db_path}")
+                    self._connect(db_path)
+                    st.success(f"Connected to LanceDB at {db_path}")
                 except Exception as e:
                     self._handle_error(e)
     
-    def _refresh_table_list(self):
-        """Refresh the list of available tables."""
+    def _refresh_table_list(self, force: bool = False):
+        """
+        Refresh the list of available tables.
+        
+        Args:
+            force: Drop the cached table lists before refreshing
+        """
         try:
-            tables = self.table_ops.list_tables()
-            st.session_state.lancedb_tables = tables.get('data', [])
+            if force:
+                _cached_list_tables.clear()
+                _cached_embedding_tables.clear()
+            st.session_state.lancedb_tables = _cached_list_tables(
+                self.db_service.db_path, self.table_ops
+            )
         except Exception as e:
             self._handle_error(e)
     
+    @st.fragment
     def display_table_browser(self):
-        """Display the table browser interface."""
-        if not st.session_state.lancedb_connected:
-            st.warning("Please connect to a LanceDB database first.")
-            return
-            
+        """
+        Display the table browser interface.
+        Runs as a fragment, so its widgets only rerun this tab.
+        Callers must check the connection first.
+        """
         try:
             st.subheader("Browse Tables")
             
@@ -142,8 +414,11 @@ class StreamlitLanceDBAdapter:
                 self._display_table_list()
                 
             with col2:
-                if st.session_state.current_table:
-                    self._display_table_details(st.session_state.current_table)
+                # current_table is the radio's widget key, which Streamlit
+                # drops while the radio is not shown
+                current_table = st.session_state.get('current_table')
+                if current_table:
+                    self._display_table_details(current_table)
                     
         except Exception as e:
             self._handle_error(e)
@@ -154,20 +429,21 @@ class StreamlitLanceDBAdapter:
         
         if st.button("Refresh Tables"):
             with st.spinner("Refreshing table list..."):
-                self._refresh_table_list()
+                self._refresh_table_list(force=True)
+                self._invalidate_table_description()
                 st.success(f"Found {len(st.session_state.lancedb_tables)} tables")
-                st.rerun()
         
-        if st.session_state.lancedb_tables:
-            selected_table = st.radio(
+        tables = st.session_state.lancedb_tables
+        if tables:
+            # The radio writes the selection straight to session state
+            if st.session_state.get('current_table') not in tables:
+                st.session_state.current_table = tables[0]
+            st.radio(
                 "Select Table",
-                st.session_state.lancedb_tables,
+                tables,
+                key="current_table",
                 label_visibility="collapsed"
             )
-            
-            if selected_table != st.session_state.current_table:
-                st.session_state.current_table = selected_table
-                st.rerun()
         else:
             st.info("No tables found. Create a table or refresh the list.")
     
@@ -176,6 +452,12 @@ class StreamlitLanceDBAdapter:
         try:
             st.subheader(f"Table: {table_name}")
             
+            # Fetch schema, preview and columns once for all the tabs
+            description = self._get_table_description(table_name)
+            
+            # Interactive tabs are fragments: their widgets rerun only the tab,
+            # not the connection checks and table list above
+            
             tab1, tab2, tab3, tab4, tab5 = st.tabs([
                 "Preview Data", 
                 "Browse Table",
@@ -185,141 +467,188 @@ class StreamlitLanceDBAdapter:
             ])
             
             with tab1:
-                self._display_table_preview(table_name)
+                self._display_table_preview(table_name, description)
                 
             with tab2:
-                self._display_browse_table(table_name)
+                self._display_browse_table(table_name, description)
                 
             with tab3:
-                self._display_table_schema(table_name)
+                self._display_table_schema(description)
                 
             with tab4:
-                self._display_query_interface(table_name)
+                self._display_query_interface(table_name, description)
                 
             with tab5:
-                self._display_embedding_interface(table_name)
+                self._display_embedding_interface(table_name, description)
                 
         except Exception as e:
             self._handle_error(e)
     
-    def _display_table_preview(self, table_name: str):
+    def _get_table_description(self, table_name: str) -> Dict[str, Any]:
+        """
+        Get the schema, preview and queryable columns of a table.
+        Only the table version is read on reruns; the description itself is
+        cached per version, so it is shared by sessions and refreshed on writes.
+        
+        Args:
+            table_name: Table to describe
+            
+        Returns:
+            Dictionary with the table description
+            
+        Raises:
+            AppError: If the table cannot be described
+        """
+        version = self.table_ops.get_table_version(table_name)
+        if not version['success']:
+            raise AppError(version['error']['message'])
+        return _cached_table_description(
+            self.db_service.db_path, table_name, version['data'], self.table_ops
+        )
+    
+    def _invalidate_table_description(self):
+        """
+        Drop cached table descriptions and rows so they are read again.
+        Needed after replacing a table, since that restarts its version.
+        """
+        _cached_table_description.clear()
+        _cached_table_data.clear()
+    
+    @st.fragment
+    def _display_table_preview(self, table_name: str, description: Dict[str, Any]):
         """Display a preview of table data."""
-        limit = st.slider("Number of rows to preview", 5, 100, 10)
+        # The controls only apply on submit, so adjusting several of them
+        # costs one read instead of one per change
+        with st.form(f"preview_controls_{table_name}"):
+            # Discrete page sizes, so resizing is one read instead of one per slider step
+            limit = st.selectbox(
+                "Rows per preview page", [10, 25, 50, 100], key=f"preview_limit_{table_name}"
+            )
+            page = st.number_input(
+                "Page", min_value=0, value=0, step=1, key=f"preview_page_{table_name}"
+            )
+            show_vectors = st.checkbox(
+                "Show vector columns (truncated)", key=f"preview_vectors_{table_name}"
+            )
+            st.form_submit_button("Apply")
         
         with st.spinner("Loading data preview..."):
-            result = self.table_ops.get_table_data(table_name, limit)
-            if result['success']:
-                data = result['data']
-                st.write(f"Showing {data['row_count']} rows")
-                
-                # Get the data without adding a selection column
-                df = data['data'].copy()
-                
-                # Display the table with selection column
-                edited_df = st.data_editor(
-                    df,
-                    use_container_width=True,
-                    num_rows="dynamic",
-                    hide_index=True,
-                    key=f"table_{table_name}"
-                )
-                
+            # The first page is part of the table description
+            if page == 0 and limit == description['preview_limit'] and not show_vectors:
+                preview = description['preview']
+            else:
+                try:
+                    preview = _cached_table_data(
+                        self.db_service.db_path, table_name, limit, page * limit,
+                        show_vectors, description['version'], self.table_ops
+                    )
+                except AppError as e:
+                    self._handle_error(e)
+                    return
+                if show_vectors:
+                    preview = _truncate_vectors(preview)
+            
+            st.caption(f"Showing {preview.num_rows} of {description['row_count']} rows")
+            
+            # Prepend a checkbox column; Arrow shares the existing column
+            # buffers, so this does not copy the preview
+            editor_data = preview.add_column(
+                0, "Select", pa.array(np.zeros(preview.num_rows, dtype=bool))
+            )
+            edited = st.data_editor(
+                editor_data,
+                use_container_width=True,
+                hide_index=True,
+                disabled=preview.column_names,
+                column_config={
+                    "Select": st.column_config.CheckboxColumn("Select", default=False)
+                },
+                key=f"table_{table_name}"
+            )
+            
+            self._prefetch_next_preview_page(table_name, description, limit, page, show_vectors)
+            
+            selected_rows = _selected_rows(preview, edited)
+            if selected_rows.num_rows > 0 and st.button(
+                f"Delete {selected_rows.num_rows} selected rows", key=f"delete_rows_{table_name}"
+            ):
                 # Create a container for status messages
                 status_container = st.container()
-                
-                # Get selected rows using Streamlit's built-in selection
-                selected_rows = []
-                if f"table_{table_name}" in st.session_state and "selected_rows" in st.session_state[f"table_{table_name}"]:
-                    selected_rows = edited_df[edited_df.index.isin(st.session_state[f"table_{table_name}"]["selected_rows"])]
+                try:
+                    # Create filter conditions for selected rows
+                    filter_conditions = selected_rows.to_pylist()
                     
-                    if len(selected_rows) > 0:
-                        try:
-                            # Show selected rows in an expander
-                            with st.expander("Selected Rows", expanded=True):
-                                st.write("You have selected the following rows:")
-                                st.dataframe(selected_rows)
-                            
-                            # Create filter conditions for selected rows
-                            filter_conditions = []
-                            for _, row in selected_rows.iterrows():
-                                row_dict = row.to_dict()
-                                filter_conditions.append(row_dict)
-                            
-                            # Show deletion progress in an expander
-                            with st.expander("Deletion Progress", expanded=True):
-                                progress_bar = st.progress(0)
-                                status_text = st.empty()
-                                
-                                # Delete each selected row
-                                total_deleted = 0
-                                for i, condition in enumerate(filter_conditions):
-                                    status_text.text(f"Deleting row {i+1} of {len(filter_conditions)}...")
-                                    
-                                    # Show the condition being used
-                                    st.write("Filter condition:", condition)
-                                    
-                                    result = self.table_ops.delete_rows(table_name, condition)
-                                    if result['success']:
-                                        deleted = result['data']['rows_deleted']
-                                        total_deleted += deleted
-                                        if deleted > 0:
-                                            st.write(f"✓ Row {i+1} deleted successfully")
-                                        else:
-                                            st.write(f"⚠ Row {i+1} not found or already deleted")
-                                            if 'warning' in result['data']:
-                                                st.write(f"Warning: {result['data']['warning']}")
-                                    else:
-                                        st.error(f"✗ Failed to delete row {i+1}: {result.get('error', 'Unknown error')}")
-                                    
-                                    # Update progress
-                                    progress = (i + 1) / len(filter_conditions)
-                                    progress_bar.progress(progress)
-                                
-                                status_text.text("Deletion complete!")
-                            
-                            if total_deleted > 0:
-                                status_container.success(f"Successfully deleted {total_deleted} rows.")
-                                st.rerun()  # Refresh the view
-                            else:
-                                status_container.warning("No rows were deleted. The selected rows may not exist in the table.")
-                            
-                        except Exception as e:
-                            status_container.error(f"Error during deletion: {str(e)}")
-                            self._handle_error(e)
-            else:
-                self._handle_error(AppError(result['error']['message']))
+                    # Delete all selected rows in one pass over the table
+                    with st.spinner(f"Deleting {len(filter_conditions)} rows..."):
+                        result = self.table_ops.delete_rows(table_name, filter_conditions)
+                    
+                    total_deleted = 0
+                    if result['success']:
+                        total_deleted = result['data']['rows_deleted']
+                        if 'warning' in result['data']:
+                            st.write(f"Warning: {result['data']['warning']}")
+                    else:
+                        st.error(f"✗ Failed to delete rows: {result['error']['message']}")
+                    
+                    if total_deleted > 0:
+                        status_container.success(f"Successfully deleted {total_deleted} rows.")
+                        self._invalidate_table_description()
+                        st.rerun()  # Refresh the view
+                    else:
+                        status_container.warning("No rows were deleted. The selected rows may not exist in the table.")
+                    
+                except Exception as e:
+                    status_container.error(f"Error during deletion: {str(e)}")
+                    self._handle_error(e)
+    
+    def _prefetch_next_preview_page(self, table_name: str, description: Dict[str, Any],
+                                    limit: int, page: int, show_vectors: bool):
+        """
+        Read the next preview page in the background while this one renders,
+        so paging forward is served from the cache.
+        """
+        offset = (page + 1) * limit
+        if offset >= description['row_count']:
+            return
+        
+        # Start each page read once per session and table version
+        args = (self.db_service.db_path, table_name, limit, offset,
+                show_vectors, description['version'], self.table_ops)
+        prefetched = st.session_state.setdefault('_prefetched_pages', set())
+        if args[:-1] in prefetched:
+            return
+        prefetched.add(args[:-1])
+        
+        thread = threading.Thread(target=_prefetch_table_data, args=args, daemon=True)
+        add_script_run_ctx(thread, get_script_run_ctx())
+        thread.start()
     
-    def _display_browse_table(self, table_name: str):
+    @st.fragment
+    def _display_browse_table(self, table_name: str, description: Dict[str, Any]):
         """Display paginated table browser."""
         
         # Initialize session state for this table
         page_key = f"browse_{table_name}_page"
         size_key = f"browse_{table_name}_page_size"
         
-        if page_key not in st.session_state:
-            st.session_state[page_key] = 1
-        if size_key not in st.session_state:
-            st.session_state[size_key] = 50
+        st.session_state.setdefault(page_key, 1)
+        st.session_state.setdefault(size_key, 50)
         
-        # Page size selector
+        # Page size selector, going back to page 1 when it changes
         page_size = st.selectbox(
             "Rows per page",
-            [25, 50, 100],
-            index=1,  # Default to 50
-            key=size_key
+            [25, 50, 100, 1000, 5000],
+            key=size_key,
+            on_change=lambda: st.session_state.update({page_key: 1})
         )
         
-        # Reset to page 1 if page size changes
-        if st.session_state[size_key] != page_size:
-            st.session_state[page_key] = 1
-            st.session_state[size_key] = page_size
-        
         current_page = st.session_state[page_key]
         
         # Get paginated data
         with st.spinner("Loading data..."):
             result = self.table_ops.get_table_data_paginated(
-                table_name, current_page, page_size
+                table_name, current_page, page_size, batch_size=1024,
+                total_rows=description['row_count']
             )
             
             if result['success']:
@@ -330,21 +659,39 @@ class StreamlitLanceDBAdapter:
                         f"{min(current_page*page_size, data['total_rows'])} "
                         f"of {data['total_rows']} rows")
                 
-                # Display data
-                st.dataframe(data['data'], use_container_width=True, hide_index=True)
+                # Display data batch by batch, so the first rows show up
+                # before large pages are fully read. The first batch is sent
+                # as Arrow; add_rows converts to pandas itself, so later
+                # batches are handed over as they are.
+                placeholder = st.empty()
+                frame = None
+                for batch in data['data']:
+                    if frame is None:
+                        frame = placeholder.dataframe(
+                            pa.Table.from_batches([batch]),
+                            use_container_width=True, hide_index=True
+                        )
+                    else:
+                        frame.add_rows(pa.Table.from_batches([batch]))
                 
                 # Navigation controls
                 col1, col2, col3 = st.columns([1, 2, 1])
                 
+                # Moving the page in a callback lands it before the rerun,
+                # so no second rerun is needed to show the new page
                 with col1:
-                    if data['has_previous'] and st.button("◀ Previous"):
-                        st.session_state[page_key] -= 1
-                        st.rerun()
+                    if data['has_previous']:
+                        st.button(
+                            "◀ Previous",
+                            on_click=lambda: st.session_state.update({page_key: current_page - 1})
+                        )
                 
                 with col3:
-                    if data['has_next'] and st.button("Next ▶"):
-                        st.session_state[page_key] += 1
-                        st.rerun()
+                    if data['has_next']:
+                        st.button(
+                            "Next ▶",
+                            on_click=lambda: st.session_state.update({page_key: current_page + 1})
+                        )
                 
                 with col2:
                     st.write(f"Page {current_page} of {data['total_pages']}")
@@ -352,55 +699,79 @@ class StreamlitLanceDBAdapter:
             else:
                 st.error(f"Failed to load data: {result['error']['message']}")
     
-    def _display_table_schema(self, table_name: str):
+    def _display_table_schema(self, description: Dict[str, Any]):
         """Display table schema information."""
-        try:
-            schema = self.table_ops.get_table_schema(table_name)
-            if schema['success']:
-                st.json(schema['data'])
-            else:
-                self._handle_error(AppError(schema['error']['message']))
-        except Exception as e:
-            self._handle_error(e)
+        schema = description['schema']
+        infos = list(schema.values())
+        # Build an Arrow table from whole columns, rendered without pandas
+        schema_table = pa.table({
+            "Name": pa.array(list(schema), type=pa.string()),
+            "Type": pa.array([info['type'] for info in infos], type=pa.string()),
+            "Nullable": pa.array([info['nullable'] for info in infos], type=pa.bool_()),
+            "Vector": pa.array([info['is_vector'] for info in infos], type=pa.bool_())
+        })
+        st.dataframe(schema_table, use_container_width=True, hide_index=True)
     
-    def _display_query_interface(self, table_name: str):
+    @st.fragment
+    def _display_query_interface(self, table_name: str, description: Dict[str, Any]):
         """Display the query interface for a table."""
         try:
-            result = self.table_ops.get_non_vector_columns(table_name)
-            if not result['success']:
-                st.error("Failed to get table columns")
-                return
-                
-            columns = result['data']
+            columns = description['filterable_columns']
             if not columns:
                 st.info("No queryable columns found in this table")
                 return
                 
-            col = st.selectbox("Select column to filter", columns)
-            op = st.selectbox("Select operator", ["equals", "contains", "greater than", "less than"])
-            value = st.text_input("Enter filter value")
+            with st.form(f"query_form_{table_name}"):
+                col = st.selectbox("Select column to filter", columns)
+                op = st.selectbox("Select operator", ["equals", "contains", "greater than", "less than"])
+                value = st.text_input("Enter filter value")
+                # Only the chosen columns are read and sent to the browser
+                selected = st.multiselect(
+                    "Columns to return", list(description['schema']),
+                    default=description['non_vector_columns']
+                )
+                submitted = st.form_submit_button("Execute Query")
+            
+            if submitted:
+                if selected:
+                    self._execute_table_query(table_name, col, op, value, selected)
+                else:
+                    st.warning("Select at least one column to return")
             
-            if st.button("Execute Query"):
-                self._execute_table_query(table_name, col, op, value)
+            # The last result is kept, so it survives reruns from other widgets
+            data = st.session_state.get(f"query_result_{table_name}")
+            if data is not None:
+                limited = " (limit reached)" if data['row_count'] >= data['limit'] else ""
+                st.caption(
+                    f"{data['row_count']} matching rows{limited} for `` {data['filter']} ``"
+                )
+                st.dataframe(data['data'], use_container_width=True)
                 
         except Exception as e:
             self._handle_error(e)
     
-    def _execute_table_query(self, table_name: str, col: str, op: str, value: str):
-        """Execute a query on a table."""
+    def _execute_table_query(self, table_name: str, col: str, op: str, value: str,
+                             columns: List[str]):
+        """Execute a query on a table and keep the result in session state."""
+        key = f"query_result_{table_name}"
         try:
-            # Implementation of query execution
-            pass
+            result = self.table_ops.query_table(table_name, col, op, value, columns=columns)
+            if not result['success']:
+                st.session_state.pop(key, None)
+                st.error(result['error']['message'])
+                return
+                
+            st.session_state[key] = result['data']
         except Exception as e:
             self._handle_error(e)
     
-    def _display_embedding_interface(self, table_name: str):
+    def _display_embedding_interface(self, table_name: str, description: Dict[str, Any]):
         """Display interface for creating embeddings from selected fields."""
         st.write("Create embeddings by combining selected fields")
         
         try:
             # Get available models
-            models = self.embedding_service.get_available_models()
+            models = _cached_models()
             model_name = st.selectbox(
                 "Select embedding model",
                 list(models.keys()),
@@ -409,12 +780,7 @@ class StreamlitLanceDBAdapter:
             )
             
             # Get non-vector columns for selection
-            result = self.table_ops.get_non_vector_columns(table_name)
-            if not result['success']:
-                st.error("Failed to get table columns")
-                return
-                
-            columns = result['data']
+            columns = description['non_vector_columns']
             if not columns:
                 st.info("No text columns found in this table")
                 return
@@ -441,7 +807,11 @@ class StreamlitLanceDBAdapter:
                 else:
                     with st.spinner("Generating embeddings..."):
                         try:
-                            result = self.table_ops.create_embeddings(
+                            table_ops = TableOperationsService(
+                                db_service=self.db_service,
+                                embedding_service=self.embedding_service
+                            )
+                            result = table_ops.create_embeddings(
                                 table_name=table_name,
                                 selected_fields=selected_fields,
                                 embedding_column=embedding_column,
@@ -455,6 +825,10 @@ class StreamlitLanceDBAdapter:
                                     f"(dimension: {data['embedding_dimension']}) "
                                     f"in column '{data['embedding_column']}'"
                                 )
+                                # The embedding column changes the table schema
+                                self._invalidate_table_description()
+                                _cached_embedding_tables.clear()
+                                
                                 # Show details in an expander
                                 with st.expander("Details"):
                                     st.json(data)
@@ -466,42 +840,37 @@ class StreamlitLanceDBAdapter:
         except Exception as e:
             self._handle_error(e)
     
+    @st.fragment
     def display_semantic_search(self):
-        """Display the semantic search interface."""
-        if not st.session_state.lancedb_connected:
-            st.warning("Please connect to a LanceDB database first.")
-            return
-            
+        """
+        Display the semantic search interface.
+        Runs as a fragment, so its widgets only rerun this tab.
+        Callers must check the connection first.
+        """
         try:
             st.subheader("Semantic Search")
             
             # Get tables with embeddings
-            embedding_tables = self.semantic_search.get_embedding_tables()
-            if not embedding_tables['success']:
-                self._handle_error(AppError(embedding_tables['error']['message']))
-                return
-                
-            if not embedding_tables['data']:
+            embedding_tables = _cached_embedding_tables(
+                self.db_service.db_path, self.semantic_search
+            )
+            if not embedding_tables:
                 st.info("No tables with embedding columns found.")
                 return
                 
             # Display search interface
             table_name, embedding_col = st.selectbox(
                 "Select table",
-                embedding_tables['data'],
+                embedding_tables,
                 format_func=lambda x: f"{x[0]} (embedding: {x[1]})"
             )
             
             # Get available models
-            models = self.semantic_search.get_available_models()
-            if not models['success']:
-                self._handle_error(AppError(models['error']['message']))
-                return
-                
+            models = _cached_models()
             model_name = st.selectbox(
                 "Select model",
-                list(models['data'].keys()),
-                format_func=lambda x: f"{x} ({models['data'][x]['description']})"
+                list(models.keys()),
+                format_func=lambda x: f"{x} ({models[x]['description']})"
             )
             
             query = st.text_area("Enter search query")
@@ -511,6 +880,14 @@ class StreamlitLanceDBAdapter:
                 self._perform_semantic_search(
                     table_name, query, embedding_col, model_name, limit
                 )
+            
+            with st.expander("Vector index"):
+                st.caption(
+                    "Without an index every search scans all vectors. "
+                    "Build it again after adding many rows."
+                )
+                if st.button("Build Index"):
+                    self._build_vector_index(table_name, embedding_col)
                 
         except Exception as e:
             self._handle_error(e)
@@ -520,11 +897,12 @@ class StreamlitLanceDBAdapter:
         """Perform semantic search and display results."""
         try:
             with st.spinner("Performing search..."):
-                results = self.semantic_search.search_by_text(
+                query_vector = _encode(model_name, query)
+                results = self.semantic_search.search_by_vector(
                     table_name=table_name,
-                    query_text=query,
+                    query_vector=query_vector,
                     embedding_column=embedding_col,
-                    model_name=model_name,
+                    expected_dim=self.embedding_service.get_embedding_dimension(model_name),
                     limit=limit
                 )
                 
@@ -543,12 +921,27 @@ class StreamlitLanceDBAdapter:
         except Exception as e:
             self._handle_error(e)
     
+    def _build_vector_index(self, table_name: str, embedding_col: str):
+        """Build an index on an embedding column and report the result."""
+        with st.spinner("Building index..."):
+            result = self.semantic_search.build_vector_index(table_name, embedding_col)
+        
+        if result['success']:
+            info = result['data']
+            st.success(
+                f"Built IVF_PQ index on '{embedding_col}' "
+                f"({info['num_partitions']} partitions, {info['num_sub_vectors']} sub-vectors)"
+            )
+        else:
+            st.error(result['error']['message'])
+    
+    @st.fragment
     def display_create_table(self):
-        """Display the table creation interface."""
-        if not st.session_state.lancedb_connected:
-            st.warning("Please connect to a LanceDB database first.")
-            return
-            
+        """
+        Display the table creation interface.
+        Runs as a fragment, so its widgets only rerun this tab.
+        Callers must check the connection first.
+        """
         try:
             st.subheader("Create Table")
             
@@ -567,50 +960,58 @@ class StreamlitLanceDBAdapter:
     
     def _display_upload_interface(self):
         """Display interface for uploading data."""
-        table_name = st.text_input("Table name")
-        uploaded_file = st.file_uploader("Choose a file", type=['csv', 'parquet'])
-        
-        if uploaded_file and table_name:
-            if st.button("Create Table"):
-                with st.spinner("Creating table..."):
-                    try:
-                        result = self.table_ops.create_table(
-                            table_name=table_name,
-                            data=uploaded_file
-                        )
+        with st.form("upload_form"):
+            table_name = st.text_input("Table name")
+            uploaded_file = st.file_uploader("Choose a file", type=['csv', 'parquet'])
+            submitted = st.form_submit_button("Create Table")
+        
+        if submitted and not (uploaded_file and table_name):
+            st.warning("Please provide a table name and a file")
+        elif submitted:
+            with st.spinner("Creating table..."):
+                try:
+                    result = self.table_ops.create_table(
+                        table_name=table_name,
+                        data=uploaded_file
+                    )
+                    
+                    if result['success']:
+                        st.success(f"Table '{table_name}' created successfully!")
+                        self._refresh_table_list(force=True)
+                    else:
+                        self._handle_error(AppError(result['error']['message']))
                         
-                        if result['success']:
-                            st.success(f"Table '{table_name}' created successfully!")
-                            self._refresh_table_list()
-                        else:
-                            self._handle_error(AppError(result['error']['message']))
-                            
-                    except Exception as e:
-                        self._handle_error(e)
+                except Exception as e:
+                    self._handle_error(e)
     
     def _display_sample_table_interface(self):
         """Display interface for creating sample tables."""
-        table_name = st.text_input("Table name")
-        columns = st.text_input("Column names (comma-separated)")
-        
-        if table_name and columns:
-            col_list = [c.strip() for c in columns.split(",")]
-            if st.button("Create Sample Table"):
-                with st.spinner("Creating sample table..."):
-                    try:
-                        result = self.table_ops.create_sample_table(
-                            table_name=table_name,
-                            columns=col_list
-                        )
+        with st.form("sample_table_form"):
+            table_name = st.text_input("Table name")
+            columns = st.text_input("Column names (comma-separated)")
+            submitted = st.form_submit_button("Create Sample Table")
+        
+        # Blank entries such as a trailing comma are dropped
+        col_list = [c for c in map(str.strip, columns.split(",")) if c] if submitted else []
+        
+        if submitted and not (table_name and col_list):
+            st.warning("Please provide a table name and column names")
+        elif submitted:
+            with st.spinner("Creating sample table..."):
+                try:
+                    result = self.table_ops.create_sample_table(
+                        table_name=table_name,
+                        columns=col_list
+                    )
+                    
+                    if result['success']:
+                        st.success(f"Sample table '{table_name}' created successfully!")
+                        self._refresh_table_list(force=True)
+                    else:
+                        self._handle_error(AppError(result['error']['message']))
                         
-                        if result['success']:
-                            st.success(f"Sample table '{table_name}' created successfully!")
-                            self._refresh_table_list()
-                        else:
-                            self._handle_error(AppError(result['error']['message']))
-                            
-                    except Exception as e:
-                        self._handle_error(e)
+                except Exception as e:
+                    self._handle_error(e)
     
     def _display_footer(self):
         """Display the application footer with copyright and links."""
@@ -645,7 +1046,8 @@ class StreamlitLanceDBAdapter:
         # Handle connection first
         self.handle_connection()
         
-        # Show main interface if connected
+        # Show main interface if connected. The check stays outside the
+        # tab fragments so their reruns skip it.
         if st.session_state.lancedb_connected:
             tab1, tab2, tab3 = st.tabs([
                 "Browse Tables",
@@ -1,6 +1,5 @@
 import streamlit as st
-import pandas as pd
-from adapters.streamlit_adapter import StreamlitLanceDBAdapter
+from components import lancedb_browser
 
 # Set page configuration
 st.set_page_config(
@@ -11,13 +10,11 @@ st.set_page_config(
 )
 
 # Initialize session state variables
-if 'data' not in st.session_state:
-    st.session_state.data = None
+st.session_state.setdefault('data', None)
 
 # Application title and description
 st.title("LanceDB Browser")
 st.caption("A mini workbench for browsing and exploring LanceDB tables")
 
-# Initialize and run the adapter
-adapter = StreamlitLanceDBAdapter()
-adapter.run_browser_interface()
\ No newline at end of file
+# Initialize and run the browser
+lancedb_browser()
\ No newline at end of file
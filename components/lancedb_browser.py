@@ -2,18 +2,17 @@
 LanceDB Browser Component
 
 This is the main entry point for the LanceDB Browser application.
-It initializes and runs the StreamlitAdapter.
+It initializes and runs the StreamlitLanceDBAdapter.
 """
-import streamlit as st
-from adapters.streamlit_adapter import StreamlitAdapter
+from adapters.streamlit_adapter import StreamlitLanceDBAdapter
 
 def lancedb_browser():
     """
     Initialize and run the LanceDB Browser application.
-    Uses the StreamlitAdapter to handle all UI and database interactions.
+    Uses the StreamlitLanceDBAdapter to handle all UI and database interactions.
     """
     # Create the adapter instance
-    adapter = StreamlitAdapter()
+    adapter = StreamlitLanceDBAdapter()
     
     # Run the main browser interface
     adapter.run_browser_interface()
@@ -6,8 +6,12 @@ for the LanceDB Browser application, independent of any UI framework.
 """
 import os
 import json
+import logging
 from typing import Dict, Any, Optional
 
+# Configure logging
+logger = logging.getLogger(__name__)
+
 
 class ConfigManager:
     """
@@ -41,7 +45,7 @@ class ConfigManager:
                 with open(self.config_path, 'r') as f:
                     self.config = json.load(f)
             except Exception as e:
-                print(f"Error loading config from {self.config_path}: {str(e)}")
+                logger.error(f"Error loading config from {self.config_path}: {str(e)}")
         
         # Override with environment variables
         self._load_from_env()
@@ -77,7 +81,7 @@ class ConfigManager:
             with open(self.config_path, 'w') as f:
                 json.dump(self.config, f, indent=2)
         except Exception as e:
-            print(f"Error saving config to {self.config_path}: {str(e)}")
+            logger.error(f"Error saving config to {self.config_path}: {str(e)}")
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -4,16 +4,156 @@ Embedding Service Module
 This module provides a service for managing embeddings and models.
 Includes model caching and embedding generation functionality.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Callable, TYPE_CHECKING
 import logging
-from sentence_transformers import SentenceTransformer
+import os
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future
 import numpy as np
 from functools import lru_cache
 
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
 # Configure logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Number of (model, text) embeddings kept per service
+_EMBEDDING_CACHE_SIZE = 1000
+
+# Single-text requests arriving within this window are encoded together
+_BATCH_WINDOW_SECONDS = 0.005
+_MAX_BATCH_SIZE = 64
+# The batching worker exits after this long without requests
+_WORKER_IDLE_SECONDS = 30.0
+
+@lru_cache(maxsize=None)
+def _load_sentence_transformer(model_name: str) -> 'SentenceTransformer':
+    """
+    Load a model once per process, so its weights are shared by all
+    EmbeddingService instances.
+    
+    Args:
+        model_name: Name of the model to load
+        
+    Returns:
+        Loaded model
+    """
+    # Imported here since it pulls in torch, which is only needed
+    # once a model is actually used
+    from sentence_transformers import SentenceTransformer
+    
+    # Opt-in ONNX Runtime backend (needs sentence-transformers[onnx]);
+    # EMBEDDING_ONNX_FILE selects an exported file such as a quantized
+    # onnx/model_qint8_avx512_vnni.onnx
+    backend = os.environ.get('EMBEDDING_BACKEND', 'torch').lower()
+    if backend == 'onnx':
+        onnx_file = os.environ.get('EMBEDDING_ONNX_FILE')
+        model_kwargs = {'file_name': onnx_file} if onnx_file else None
+        logger.info(f"Loading model: {model_name} (ONNX Runtime)")
+        return SentenceTransformer(model_name, backend='onnx', model_kwargs=model_kwargs)
+    
+    logger.info(f"Loading model: {model_name}")
+    return SentenceTransformer(model_name)
+
+class _EmbeddingBatcher:
+    """
+    Coalesces concurrent single-text encode requests into batched
+    model.encode calls, run on one background worker thread.
+    The worker only runs while there are requests, so it does not keep
+    the owning service alive.
+    """
+    
+    def __init__(self, get_model: Callable[[str], 'SentenceTransformer']):
+        self._get_model = get_model
+        self._pending: List[Tuple[str, str, Future]] = []
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+    
+    def encode(self, text: str, model_name: str) -> np.ndarray:
+        """
+        Encode one text, batched with any requests made at the same time.
+        
+        Args:
+            text: Text to encode
+            model_name: Name of the model to use
+            
+        Returns:
+            Embedding vector
+        """
+        future = Future()
+        with self._condition:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="embedding-batcher", daemon=True
+                )
+                self._worker.start()
+            self._pending.append((text, model_name, future))
+            self._condition.notify()
+        return future.result()
+    
+    def _run(self):
+        """Worker loop: wait for requests, then encode them per model."""
+        batch: List[Tuple[str, str, Future]] = []
+        try:
+            while True:
+                with self._condition:
+                    if not self._condition.wait_for(
+                        lambda: self._pending, timeout=_WORKER_IDLE_SECONDS
+                    ):
+                        # Idle: the next request starts a new worker
+                        self._worker = None
+                        return
+                    # Give concurrent callers a moment to join the batch
+                    self._condition.wait_for(
+                        lambda: len(self._pending) >= _MAX_BATCH_SIZE, timeout=_BATCH_WINDOW_SECONDS
+                    )
+                    batch = self._pending[:_MAX_BATCH_SIZE]
+                    del self._pending[:_MAX_BATCH_SIZE]
+                
+                self._encode_batch(batch)
+        except BaseException as e:
+            # Don't leave callers waiting on a worker that is gone; reset it
+            # under the same lock so later requests start a new one
+            error = EmbeddingError(f"Embedding worker stopped: {e!r}")
+            with self._condition:
+                for _, _, future in batch + self._pending:
+                    if not future.done():
+                        future.set_exception(error)
+                self._pending.clear()
+                self._worker = None
+            raise
+    
+    def _encode_batch(self, batch: List[Tuple[str, str, Future]]):
+        """Encode a batch of requests, grouped by model, and resolve their futures."""
+        by_model = defaultdict(list)
+        for text, model_name, future in batch:
+            by_model[model_name].append((text, future))
+        
+        for model_name, requests in by_model.items():
+            try:
+                vectors = self._encode_texts(model_name, [text for text, _ in requests])
+            except Exception as e:
+                if len(requests) == 1:
+                    requests[0][1].set_exception(e)
+                    continue
+                # Encode one by one, so a bad input only fails its own request
+                for text, future in requests:
+                    try:
+                        future.set_result(self._encode_texts(model_name, [text])[0])
+                    except Exception as single_error:
+                        future.set_exception(single_error)
+                continue
+            for (_, future), vector in zip(requests, vectors):
+                future.set_result(vector)
+    
+    def _encode_texts(self, model_name: str, texts: List[str]) -> np.ndarray:
+        """Encode texts with a model in one call."""
+        model = self._get_model(model_name)
+        return model.encode(texts, batch_size=_MAX_BATCH_SIZE, convert_to_numpy=True)
+
 class ModelNotFoundError(Exception):
     """Exception for when a requested model is not available"""
     pass
@@ -49,8 +189,11 @@ class EmbeddingService:
     }
     
     def __init__(self):
-        self._model_cache: Dict[str, SentenceTransformer] = {}
         logger.info("Initializing EmbeddingService")
+        # Least recently used embeddings first, kept as float32 arrays
+        self._embedding_cache: 'OrderedDict[Tuple[str, str], np.ndarray]' = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._batcher = _EmbeddingBatcher(self.get_model)
     
     def get_available_models(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -61,9 +204,9 @@ class EmbeddingService:
         """
         return self.DEFAULT_MODELS.copy()
     
-    def _load_model(self, model_name: str) -> SentenceTransformer:
+    def _load_model(self, model_name: str) -> 'SentenceTransformer':
         """
-        Load a model into memory.
+        Load a model into memory, reusing it if it was loaded before.
         
         Args:
             model_name: Name of the model to load
@@ -75,14 +218,11 @@ class EmbeddingService:
             ModelNotFoundError: If model cannot be loaded
         """
         try:
-            logger.info(f"Loading model: {model_name}")
-            model = SentenceTransformer(model_name)
-            self._model_cache[model_name] = model
-            return model
+            return _load_sentence_transformer(model_name)
         except Exception as e:
             raise ModelNotFoundError(f"Failed to load model '{model_name}': {str(e)}")
     
-    def get_model(self, model_name: str) -> SentenceTransformer:
+    def get_model(self, model_name: str) -> 'SentenceTransformer':
         """
         Get a model, loading it if necessary.
         
@@ -95,19 +235,35 @@ class EmbeddingService:
         Raises:
             ModelNotFoundError: If model is not available
         """
-        if model_name not in self._model_cache:
-            return self._load_model(model_name)
-        return self._model_cache[model_name]
+        return self._load_model(model_name)
     
-    @lru_cache(maxsize=1000)
-    def _cached_generate_embedding(self, text: str, model_name: str) -> tuple:
+    def _cached_generate_embedding(self, text: str, model_name: str) -> np.ndarray:
         """
-        Generate an embedding with caching.
-        Note: Input is converted to tuple for hashability in lru_cache.
+        Generate an embedding, reusing it for repeated texts.
+        
+        Args:
+            text: Text to generate embedding for
+            model_name: Name of the model to use
+            
+        Returns:
+            Read-only float32 embedding vector
         """
-        model = self.get_model(model_name)
-        vector = model.encode([text], convert_to_numpy=True)[0]
-        return tuple(vector.tolist())
+        key = (model_name, text)
+        with self._cache_lock:
+            vector = self._embedding_cache.get(key)
+            if vector is not None:
+                self._embedding_cache.move_to_end(key)
+                return vector
+        
+        vector = np.asarray(self._batcher.encode(text, model_name), dtype=np.float32)
+        # Cached arrays are shared between callers
+        vector.flags.writeable = False
+        
+        with self._cache_lock:
+            self._embedding_cache[key] = vector
+            if len(self._embedding_cache) > _EMBEDDING_CACHE_SIZE:
+                self._embedding_cache.popitem(last=False)
+        return vector
     
     def generate_embedding(self, text: str, model_name: str = 'all-MiniLM-L6-v2') -> List[float]:
         """
@@ -125,8 +281,8 @@ class EmbeddingService:
             EmbeddingError: If embedding generation fails
         """
         try:
-            # Convert back from tuple to list
-            return list(self._cached_generate_embedding(text, model_name))
+            # Lists only at the API boundary, the cache keeps the array
+            return self._cached_generate_embedding(text, model_name).tolist()
         except ModelNotFoundError:
             raise
         except Exception as e:
@@ -178,5 +334,6 @@ class EmbeddingService:
     
     def clear_cache(self):
         """Clear both the model cache and the embedding cache."""
-        self._model_cache.clear()
-        self._cached_generate_embedding.cache_clear() 
\ No newline at end of file
+        _load_sentence_transformer.cache_clear()
+        with self._cache_lock:
+            self._embedding_cache.clear() 
\ No newline at end of file
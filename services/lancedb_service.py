@@ -6,7 +6,9 @@ Includes connection management, retry mechanisms, and comprehensive error handli
 """
 from typing import List, Dict, Any, Optional, Union
 import pandas as pd
+import pyarrow as pa
 import logging
+import re
 import time
 from functools import wraps
 import lancedb
@@ -24,11 +26,17 @@ def retry_operation(max_attempts: int = 3, delay: float = 1.0):
             for attempt in range(max_attempts):
                 try:
                     return func(*args, **kwargs)
+                except InvalidFilterError:
+                    # A rejected filter fails the same way on every attempt
+                    raise
                 except Exception as e:
                     last_error = e
                     if attempt < max_attempts - 1:
                         logger.warning(f"Operation failed, attempt {attempt + 1}/{max_attempts}: {str(e)}")
                         time.sleep(delay * (attempt + 1))  # Exponential backoff
+                        # The connection may have gone stale, probe it before retrying
+                        if args and isinstance(args[0], LanceDBService):
+                            args[0].ensure_connection(revalidate=True)
                     else:
                         logger.error(f"Operation failed after {max_attempts} attempts: {str(e)}")
                         raise last_error
@@ -47,6 +55,21 @@ class TableOperationError(DatabaseError):
     """Exception for table operation errors"""
     pass
 
+class InvalidFilterError(TableOperationError):
+    """Exception for filters that LanceDB rejects"""
+    pass
+
+# LanceDB error messages caused by the filter itself rather than by I/O
+_INVALID_FILTER_MESSAGE = re.compile(
+    r"Invalid user input|Schema error|sql parser error", re.IGNORECASE
+)
+
+def _filter_error(message: str, error: Exception) -> TableOperationError:
+    """Wrap a LanceDB error, marking it as not retryable if the filter caused it."""
+    if _INVALID_FILTER_MESSAGE.search(str(error)):
+        return InvalidFilterError(f"Invalid filter: {str(error)}")
+    return TableOperationError(f"{message}: {str(error)}")
+
 class LanceDBService:
     """
     Consolidated service for LanceDB operations.
@@ -65,6 +88,11 @@ class LanceDBService:
         """Check if there is an active connection"""
         return self._connection is not None
 
+    @property
+    def db_path(self) -> Optional[str]:
+        """Path of the currently connected database, if any"""
+        return self._db_path
+
     @retry_operation(max_attempts=3)
     def connect(self, db_path: str) -> bool:
         """
@@ -90,14 +118,22 @@ class LanceDBService:
             self._db_path = None
             raise ConnectionError(f"Failed to connect to database: {str(e)}")
 
-    def ensure_connection(self) -> bool:
+    def ensure_connection(self, revalidate: bool = False) -> bool:
         """
         Ensure database connection is active, reconnect if needed.
         
+        An existing connection is trusted as-is unless revalidation is
+        requested, so regular operations don't pay for a probe round-trip.
+        
+        Args:
+            revalidate: Probe the existing connection before trusting it
+            
         Returns:
             bool: True if connection is active
         """
         if self.is_connected:
+            if not revalidate:
+                return True
             try:
                 # Test connection by listing tables
                 _ = self._connection.table_names()
@@ -160,47 +196,43 @@ class LanceDBService:
             raise TableOperationError(f"Failed to delete table: {str(e)}")
 
     @retry_operation()
-    def replace_table(self, table_name: str, data: pd.DataFrame, 
-                     vector_column: Optional[str] = None) -> bool:
+    def create_table(self, table_name: str, data: Union[pd.DataFrame, pa.Table], 
+                    vector_column: Optional[str] = None) -> bool:
         """
-        Replace an existing table with new data.
+        Create a new table in the database.
         
         Args:
-            table_name: Name of the table
-            data: DataFrame with the new data
+            table_name: Name for the new table
+            data: DataFrame or Arrow table with the data
             vector_column: Optional name of vector/embedding column
             
         Returns:
-            bool: True if table was replaced successfully
+            bool: True if table created successfully
             
         Raises:
             ConnectionError: If not connected
-            TableOperationError: If operation fails
+            TableOperationError: If table creation fails
         """
         if not self.ensure_connection():
             raise ConnectionError("Not connected to database")
             
         try:
-            # Delete existing table if it exists
-            self.delete_table(table_name)
-            
-            # Create new table
-            logger.info(f"Creating replacement table '{table_name}' with {len(data)} rows")
+            logger.info(f"Creating table '{table_name}' with {len(data)} rows")
             self._connection.create_table(table_name, data=data)
             return True
         except Exception as e:
-            raise TableOperationError(f"Failed to replace table: {str(e)}")
+            raise TableOperationError(f"Failed to create table: {str(e)}")
 
-    @retry_operation()
-    def create_table(self, table_name: str, data: pd.DataFrame, 
-                    vector_column: Optional[str] = None) -> bool:
+    def create_table_from_batches(self, table_name: str,
+                                  batches: pa.RecordBatchReader) -> bool:
         """
-        Create a new table in the database.
+        Create a new table from a stream of record batches.
+        Only one batch is held in memory at a time. This is not retried,
+        since the stream can only be consumed once.
         
         Args:
             table_name: Name for the new table
-            data: DataFrame with the data
-            vector_column: Optional name of vector/embedding column
+            batches: Reader yielding the record batches
             
         Returns:
             bool: True if table created successfully
@@ -213,23 +245,54 @@ class LanceDBService:
             raise ConnectionError("Not connected to database")
             
         try:
-            logger.info(f"Creating table '{table_name}' with {len(data)} rows")
-            self._connection.create_table(table_name, data=data)
+            logger.info(f"Creating table '{table_name}' from a record batch stream")
+            self._connection.create_table(table_name, data=batches)
             return True
         except Exception as e:
             raise TableOperationError(f"Failed to create table: {str(e)}")
 
     @retry_operation()
-    def query_table(self, table_name: str, limit: int = 100) -> pd.DataFrame:
+    def delete_rows(self, table_name: str, where: str) -> bool:
         """
-        Query data from a table.
+        Delete the rows of a table matching a filter, in place.
+        
+        Args:
+            table_name: Table to delete from
+            where: SQL filter selecting the rows to delete
+            
+        Returns:
+            bool: True if the delete was applied
+            
+        Raises:
+            ConnectionError: If not connected
+            TableOperationError: If the delete fails
+        """
+        if not self.ensure_connection():
+            raise ConnectionError("Not connected to database")
+            
+        try:
+            table = self._connection[table_name]
+            table.delete(where)
+            return True
+        except Exception as e:
+            raise _filter_error("Failed to delete rows", e)
+
+    @retry_operation()
+    def query_table_arrow(self, table_name: str, offset: int = 0, limit: int = 100,
+                          columns: Optional[List[str]] = None,
+                          where: Optional[str] = None) -> pa.Table:
+        """
+        Query a window of rows from a table as an Arrow table.
         
         Args:
             table_name: Table to query
+            offset: Number of rows to skip
             limit: Maximum number of rows to return
+            columns: Columns to read (all columns if None)
+            where: Optional SQL filter evaluated by LanceDB
             
         Returns:
-            DataFrame with query results
+            Arrow table with query results
             
         Raises:
             ConnectionError: If not connected
@@ -240,23 +303,31 @@ class LanceDBService:
             
         try:
             table = self._connection[table_name]
-            return table.search().limit(limit).to_pandas()
+            query = table.search()
+            if columns is not None:
+                query = query.select(columns)
+            if where:
+                query = query.where(where)
+            return query.offset(offset).limit(limit).to_arrow()
         except Exception as e:
-            raise TableOperationError(f"Failed to query table: {str(e)}")
+            raise _filter_error("Failed to query table", e)
 
     @retry_operation()
-    def query_table_paginated(self, table_name: str, offset: int = 0, 
-                             limit: int = 50) -> pd.DataFrame:
+    def iter_table_batches(self, table_name: str, offset: int = 0, limit: int = 100,
+                           columns: Optional[List[str]] = None,
+                           batch_size: int = 1024) -> pa.RecordBatchReader:
         """
-        Query paginated data from a table using LIMIT/OFFSET.
+        Stream a window of rows from a table as Arrow record batches.
         
         Args:
             table_name: Table to query
             offset: Number of rows to skip
             limit: Maximum number of rows to return
+            columns: Columns to read (all columns if None)
+            batch_size: Maximum number of rows per batch
             
         Returns:
-            DataFrame with query results
+            Reader yielding the record batches
             
         Raises:
             ConnectionError: If not connected
@@ -267,7 +338,10 @@ class LanceDBService:
             
         try:
             table = self._connection[table_name]
-            return table.search().limit(limit).offset(offset).to_pandas()
+            query = table.search()
+            if columns is not None:
+                query = query.select(columns)
+            return query.offset(offset).limit(limit).to_batches(batch_size)
         except Exception as e:
             raise TableOperationError(f"Failed to query table: {str(e)}")
 
@@ -295,6 +369,66 @@ class LanceDBService:
         except Exception as e:
             raise TableOperationError(f"Failed to count table rows: {str(e)}")
 
+    @retry_operation()
+    def get_table_version(self, table_name: str) -> int:
+        """
+        Get the current version of a table.
+        The version increases with every write, so it identifies the table contents.
+        
+        Args:
+            table_name: Table to inspect
+            
+        Returns:
+            Table version number
+            
+        Raises:
+            ConnectionError: If not connected
+            TableOperationError: If the table cannot be opened
+        """
+        if not self.ensure_connection():
+            raise ConnectionError("Not connected to database")
+            
+        try:
+            table = self._connection[table_name]
+            return table.version
+        except Exception as e:
+            raise TableOperationError(f"Failed to get table version: {str(e)}")
+
+    def create_vector_index(self, table_name: str, vector_column: str,
+                            num_partitions: int, num_sub_vectors: int) -> bool:
+        """
+        Build (or rebuild) an IVF_PQ index on a vector column.
+        Not retried, since training the index is the expensive part.
+        
+        Args:
+            table_name: Table to index
+            vector_column: Name of the vector/embedding column
+            num_partitions: Number of IVF partitions
+            num_sub_vectors: Number of PQ sub-vectors, must divide the dimension
+            
+        Returns:
+            bool: True if the index was built
+            
+        Raises:
+            ConnectionError: If not connected
+            TableOperationError: If the index cannot be built
+        """
+        if not self.ensure_connection():
+            raise ConnectionError("Not connected to database")
+            
+        try:
+            table = self._connection[table_name]
+            table.create_index(
+                vector_column_name=vector_column,
+                index_type="IVF_PQ",
+                num_partitions=num_partitions,
+                num_sub_vectors=num_sub_vectors,
+                replace=True
+            )
+            return True
+        except Exception as e:
+            raise TableOperationError(f"Failed to build vector index: {str(e)}")
+
     @retry_operation()
     def semantic_search(self, table_name: str, query_vector: List[float],
                        vector_column: str, limit: int = 10) -> pd.DataFrame:
@@ -319,7 +453,11 @@ class LanceDBService:
             
         try:
             table = self._connection[table_name]
+            # nprobes/refine_factor only apply once the column is indexed;
+            # refining re-ranks candidates on the full vectors
             results = table.search(query_vector, vector_column_name=vector_column) \
+                         .nprobes(20) \
+                         .refine_factor(10) \
                          .limit(limit) \
                          .to_pandas()
             return results
@@ -4,16 +4,23 @@ Semantic Search Service
 This module provides semantic search functionality using the LanceDB and Embedding services.
 """
 from typing import List, Dict, Any, Tuple, Optional
+import math
 import pandas as pd
+import pyarrow as pa
+from concurrent.futures import ThreadPoolExecutor
 from services.embedding_service import EmbeddingService
 from services.lancedb_service import LanceDBService
 from utils.error_utils import with_error_handling, ValidationError, validate_vector_dimension
+from utils.schema_utils import get_vector_columns
 import logging
 
 # Configure logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# PQ codebooks are trained on 256 centroids per sub-vector
+_MIN_INDEX_ROWS = 256
+
 class SemanticSearchService:
     """
     Service for handling semantic search operations.
@@ -32,16 +39,21 @@ class SemanticSearchService:
         Returns:
             List of tuples (table_name, embedding_column)
         """
-        tables_with_embeddings = []
-        for table_name in self.db_service.list_tables():
-            table = self.db_service.get_connection()[table_name]
-            for field in table.schema:
-                # Check for likely embedding fields
-                if any(kw in field.name.lower() for kw in ["embedding", "vector"]) or \
-                   "list" in str(field.type).lower() or \
-                   "array" in str(field.type).lower():
-                    tables_with_embeddings.append((table_name, field.name))
-        return tables_with_embeddings
+        connection = self.db_service.get_connection()
+        table_names = self.db_service.list_tables()
+        
+        # Only the schemas are read, no data is scanned. The reads are
+        # independent I/O, so fan them out over a small thread pool.
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            schemas = list(executor.map(
+                lambda name: connection.open_table(name).schema, table_names
+            ))
+        
+        return [
+            (table_name, column)
+            for table_name, schema in zip(table_names, schemas)
+            for column in get_vector_columns(schema)
+        ]
     
     @with_error_handling()
     def get_available_models(self) -> Dict[str, Dict[str, Any]]:
@@ -113,6 +125,59 @@ class SemanticSearchService:
             limit=limit
         )
     
+    @with_error_handling()
+    def build_vector_index(self, table_name: str, embedding_column: str) -> Dict[str, Any]:
+        """
+        Build an IVF_PQ index on an embedding column, so searches no longer
+        scan every vector.
+        
+        Args:
+            table_name: Table to index
+            embedding_column: Column containing embeddings
+            
+        Returns:
+            Dictionary with the index parameters used
+            
+        Raises:
+            ValidationError: If the column is not a fixed-size vector column
+                or the table is too small to train the index
+        """
+        table = self.db_service.get_connection()[table_name]
+        if embedding_column not in table.schema.names:
+            raise ValidationError(f"Column '{embedding_column}' not found in table")
+        
+        field_type = table.schema.field(embedding_column).type
+        if not pa.types.is_fixed_size_list(field_type):
+            raise ValidationError(
+                f"Column '{embedding_column}' must hold fixed-size vectors to be indexed"
+            )
+        
+        row_count = self.db_service.count_table_rows(table_name)
+        if row_count < _MIN_INDEX_ROWS:
+            raise ValidationError(
+                f"At least {_MIN_INDEX_ROWS} rows are needed to build an index, "
+                f"the table has {row_count}"
+            )
+        
+        # About sqrt(N) partitions, and sub-vectors of 16 dimensions where
+        # the dimension allows it
+        dimension = field_type.list_size
+        num_partitions = max(1, int(math.sqrt(row_count)))
+        num_sub_vectors = next(
+            n for n in (dimension // 16, dimension // 8, dimension // 4, 1)
+            if n > 0 and dimension % n == 0
+        )
+        
+        self.db_service.create_vector_index(
+            table_name, embedding_column, num_partitions, num_sub_vectors
+        )
+        return {
+            'table_name': table_name,
+            'embedding_column': embedding_column,
+            'num_partitions': num_partitions,
+            'num_sub_vectors': num_sub_vectors
+        }
+    
     @with_error_handling()
     def process_search_results(self, results: pd.DataFrame,
                              exclude_columns: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -4,16 +4,50 @@ Table Operations Service
 This module provides table operation functionality using the LanceDB service.
 """
 from typing import List, Dict, Any, Optional, Union, IO
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as papq
 from services.lancedb_service import LanceDBService
 from services.embedding_service import EmbeddingService
 from utils.error_utils import with_error_handling, ValidationError, validate_table_name
+from utils.schema_utils import (
+    is_vector_field, is_filterable_field, get_display_columns, get_filterable_columns
+)
+import datetime
 import logging
+import math
+import re
 
 # Configure logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Classifies sample column names by keyword. The branches are lookaheads
+# tried in order, so the first matching kind wins wherever it appears.
+_SAMPLE_COLUMN_KIND = re.compile(
+    r'(?P<embedding>(?=.*(?:embedding|vector)))'
+    r'|(?P<int>(?=.*(?:int|num|count)))'
+    r'|(?P<float>(?=.*(?:float|decimal|price)))',
+    re.IGNORECASE
+)
+
+# Query operators and the SQL they build from a quoted column and a literal
+_FILTER_BUILDERS = {
+    'equals': lambda column, literal: f"{column} = {literal}",
+    'contains': lambda column, literal: f"{column} LIKE {literal} ESCAPE '\\'",
+    'greater than': lambda column, literal: f"{column} > {literal}",
+    'less than': lambda column, literal: f"{column} < {literal}",
+}
+
+# DataFusion names of the Arrow types used in arrow_cast() literals
+_TIME_UNIT_NAMES = {'s': 'Second', 'ms': 'Millisecond', 'us': 'Microsecond', 'ns': 'Nanosecond'}
+_INDEX_TYPE_NAMES = {
+    'int8': 'Int8', 'int16': 'Int16', 'int32': 'Int32', 'int64': 'Int64',
+    'uint8': 'UInt8', 'uint16': 'UInt16', 'uint32': 'UInt32', 'uint64': 'UInt64'
+}
+
 class TableOperationsService:
     """
     Service for handling table operations.
@@ -35,22 +69,25 @@ class TableOperationsService:
         return self.db_service.list_tables()
     
     @with_error_handling()
-    def get_table_data(self, table_name: str, limit: int = 100) -> Dict[str, Any]:
+    def get_table_data(self, table_name: str, limit: int = 100,
+                       offset: int = 0, include_vectors: bool = False) -> Dict[str, Any]:
         """
-        Get data from a table.
+        Get a window of data from a table.
+        
+        Vector columns are only read on request, and the data is returned as
+        an Arrow table so it can be displayed without a pandas conversion.
         
         Args:
             table_name: Table to query
             limit: Maximum number of rows
+            offset: Number of rows to skip
+            include_vectors: Whether to read vector columns too
             
         Returns:
             Dictionary with table data and metadata
         """
         validate_table_name(table_name)
         
-        # Get the data
-        df = self.db_service.query_table(table_name, limit)
-        
         # Get schema information
         table = self.db_service.get_connection()[table_name]
         schema = {
@@ -58,22 +95,194 @@ class TableOperationsService:
             for field in table.schema
         }
         
+        # Get the data
+        columns = None if include_vectors else get_display_columns(table.schema)
+        data = self.db_service.query_table_arrow(table_name, offset, limit, columns)
+        
         return {
-            'data': df,
+            'data': data,
             'schema': schema,
-            'row_count': len(df),
-            'total_columns': len(df.columns)
+            'row_count': data.num_rows,
+            'total_columns': data.num_columns
         }
     
     @with_error_handling()
-    def create_table(self, table_name: str, data: Union[pd.DataFrame, IO],
+    def query_table(self, table_name: str, column: str, operator: str,
+                    value: str, limit: int = 1000,
+                    columns: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Query the rows of a table matching a single column filter.
+        
+        The filter is pushed down to LanceDB, so only matching rows are read.
+        
+        Args:
+            table_name: Table to query
+            column: Column to filter on
+            operator: One of 'equals', 'contains', 'greater than', 'less than'
+            value: Value to compare against
+            limit: Maximum number of rows
+            columns: Columns to return (None for all non-vector columns)
+            
+        Returns:
+            Dictionary with the matching rows and the filter used
+            
+        Raises:
+            ValidationError: If the column, operator or value is invalid
+        """
+        validate_table_name(table_name)
+        
+        table = self.db_service.get_connection()[table_name]
+        if column not in table.schema.names:
+            raise ValidationError(
+                f"Column '{column}' not found in table",
+                {'available_columns': table.schema.names}
+            )
+        
+        where = self._build_filter(table.schema.field(column), operator, value)
+        if columns is None:
+            columns = get_display_columns(table.schema)
+        else:
+            missing = [name for name in columns if name not in table.schema.names]
+            if missing:
+                raise ValidationError(
+                    f"Columns not found in table: {', '.join(missing)}",
+                    {'available_columns': table.schema.names}
+                )
+        data = self.db_service.query_table_arrow(
+            table_name, limit=limit, columns=columns, where=where
+        )
+        
+        return {
+            'data': data,
+            'filter': where,
+            'row_count': data.num_rows,
+            'limit': limit
+        }
+    
+    def _build_filter(self, field: pa.Field, operator: str, value: str) -> str:
+        """
+        Build a LanceDB SQL filter for a single column.
+        
+        Args:
+            field: Schema field of the column to filter on
+            operator: One of 'equals', 'contains', 'greater than', 'less than'
+            value: Value to compare against
+            
+        Returns:
+            SQL filter string
+            
+        Raises:
+            ValidationError: If the operator or value is invalid
+        """
+        builder = _FILTER_BUILDERS.get(operator)
+        if builder is None:
+            raise ValidationError(
+                f"Unsupported operator '{operator}'",
+                {'supported_operators': list(_FILTER_BUILDERS)}
+            )
+        if not is_filterable_field(field):
+            raise ValidationError(
+                f"Column '{field.name}' of type {field.type} can't be used in a filter"
+            )
+        
+        column = self._quote_identifier(field.name)
+        is_text = pa.types.is_string(field.type) or pa.types.is_large_string(field.type)
+        
+        if operator == 'contains':
+            if not is_text:
+                raise ValidationError("'contains' can only be used on text columns")
+            literal = f"'%{self._escape_literal(self._escape_like(value))}%'"
+        else:
+            literal = self._typed_literal(field, value)
+        
+        return builder(column, literal)
+    
+    def _typed_literal(self, field: pa.Field, value: str) -> str:
+        """
+        Build a SQL literal for a value, typed by the column's Arrow type.
+        
+        The value is cast with Arrow first, so dates, timestamps and
+        decimals are parsed exactly instead of going through float.
+        
+        Args:
+            field: Schema field of the column the value is compared with
+            value: Value as entered
+            
+        Returns:
+            SQL literal string
+            
+        Raises:
+            ValidationError: If the value cannot be cast to the column type
+        """
+        data_type = field.type
+        if pa.types.is_string(data_type) or pa.types.is_large_string(data_type):
+            return f"'{self._escape_literal(value)}'"
+        
+        # LanceDB doesn't coerce string literals to these types, so the
+        # literal is cast to the column's exact type
+        if pa.types.is_dictionary(data_type):
+            value_type = "LargeUtf8" if pa.types.is_large_string(data_type.value_type) else "Utf8"
+            target = f"Dictionary({_INDEX_TYPE_NAMES[str(data_type.index_type)]}, {value_type})"
+            return f"arrow_cast('{self._escape_literal(value)}', '{target}')"
+        if pa.types.is_time(data_type):
+            try:
+                parsed = datetime.time.fromisoformat(str(value).strip())
+            except ValueError:
+                raise ValidationError(
+                    f"'{value}' is not a valid {data_type} value for column '{field.name}'"
+                )
+            target = f"Time{data_type.bit_width}({_TIME_UNIT_NAMES[data_type.unit]})"
+            return f"arrow_cast('{parsed.isoformat()}', '{target}')"
+        
+        try:
+            scalar = pa.scalar(str(value).strip()).cast(data_type)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            raise ValidationError(
+                f"'{value}' is not a valid {data_type} value for column '{field.name}'"
+            )
+        
+        if pa.types.is_boolean(data_type):
+            return "TRUE" if scalar.as_py() else "FALSE"
+        if pa.types.is_decimal(data_type):
+            # Float literals are rejected for decimal columns
+            return f"CAST('{scalar}' AS DECIMAL({data_type.precision}, {data_type.scale}))"
+        if pa.types.is_date(data_type):
+            return f"date '{scalar.as_py().isoformat()}'"
+        if pa.types.is_timestamp(data_type):
+            return f"timestamp '{scalar.as_py()}'"
+        if pa.types.is_floating(data_type) and not math.isfinite(scalar.as_py()):
+            # Bare nan/inf would be read as column names
+            if math.isnan(scalar.as_py()):
+                raise ValidationError(
+                    f"NaN can't be compared with a filter on column '{field.name}'"
+                )
+            return f"CAST('{scalar.as_py()}' AS DOUBLE)"
+        return str(scalar.as_py())
+    
+    @staticmethod
+    def _quote_identifier(name: str) -> str:
+        """Quote a column name for use in a SQL filter."""
+        return "`" + name.replace("`", "``") + "`"
+    
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        """Escape LIKE wildcards, so a value is matched literally."""
+        return str(value).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    
+    @staticmethod
+    def _escape_literal(value: str) -> str:
+        """Escape a value for use inside a single-quoted SQL literal."""
+        return str(value).replace("'", "''")
+    
+    @with_error_handling()
+    def create_table(self, table_name: str, data: Union[pd.DataFrame, pa.Table, IO],
                     vector_column: Optional[str] = None) -> Dict[str, Any]:
         """
         Create a new table.
         
         Args:
             table_name: Name for the new table
-            data: DataFrame or file-like object (CSV/Parquet)
+            data: DataFrame, Arrow table or file-like object (CSV/Parquet)
             vector_column: Optional name of vector/embedding column
             
         Returns:
@@ -81,40 +290,56 @@ class TableOperationsService:
         """
         validate_table_name(table_name)
         
-        # Convert file-like object to DataFrame if needed
-        if not isinstance(data, pd.DataFrame):
-            df = self._load_data_from_file(data)
-        else:
-            df = data
+        # Stream file-like objects into the table batch by batch
+        if not isinstance(data, (pd.DataFrame, pa.Table)):
+            batches = self._open_file_batches(data)
+            self.db_service.create_table_from_batches(table_name, batches)
+            return {
+                'table_name': table_name,
+                'row_count': self.db_service.count_table_rows(table_name),
+                'column_count': len(batches.schema),
+                'schema': {field.name: str(field.type) for field in batches.schema}
+            }
             
         # Create the table
-        self.db_service.create_table(table_name, df, vector_column)
+        self.db_service.create_table(table_name, data, vector_column)
+        
+        if isinstance(data, pa.Table):
+            schema = {field.name: str(field.type) for field in data.schema}
+        else:
+            schema = data.dtypes.to_dict()
         
         return {
             'table_name': table_name,
-            'row_count': len(df),
-            'column_count': len(df.columns),
-            'schema': df.dtypes.to_dict()
+            'row_count': len(data),
+            'column_count': len(data.columns),
+            'schema': schema
         }
     
-    def _load_data_from_file(self, file_obj: IO) -> pd.DataFrame:
+    def _open_file_batches(self, file_obj: IO,
+                           batch_size: int = 64_000) -> pa.RecordBatchReader:
         """
-        Load data from a file object into a DataFrame.
+        Open a file object as a stream of Arrow record batches.
         
         Args:
             file_obj: File-like object
+            batch_size: Number of rows per batch for Parquet files
             
         Returns:
-            Loaded DataFrame
+            Reader yielding the record batches
             
         Raises:
             ValidationError: If file format is not supported
         """
         if hasattr(file_obj, 'name'):
             if file_obj.name.endswith('.csv'):
-                return pd.read_csv(file_obj)
+                return pacsv.open_csv(file_obj)
             elif file_obj.name.endswith('.parquet'):
-                return pd.read_parquet(file_obj)
+                parquet_file = papq.ParquetFile(file_obj)
+                return pa.RecordBatchReader.from_batches(
+                    parquet_file.schema_arrow,
+                    parquet_file.iter_batches(batch_size=batch_size)
+                )
             else:
                 raise ValidationError(
                     "Unsupported file type",
@@ -123,7 +348,7 @@ class TableOperationsService:
         
         # Try CSV as default
         try:
-            return pd.read_csv(file_obj)
+            return pacsv.open_csv(file_obj)
         except Exception as e:
             raise ValidationError(
                 "Could not parse file",
@@ -144,13 +369,24 @@ class TableOperationsService:
         validate_table_name(table_name)
         
         table = self.db_service.get_connection()[table_name]
+        return self._build_schema_info(table.schema)
+    
+    def _build_schema_info(self, schema) -> Dict[str, Dict[str, Any]]:
+        """
+        Build schema information from an Arrow schema.
         
+        Args:
+            schema: Arrow schema of a table
+            
+        Returns:
+            Dictionary with schema information
+        """
         schema_info = {}
-        for field in table.schema:
+        for field in schema:
             schema_info[field.name] = {
                 'type': str(field.type),
                 'nullable': field.nullable,
-                'is_vector': 'list' in str(field.type).lower() or 'array' in str(field.type).lower()
+                'is_vector': is_vector_field(field)
             }
         
         return schema_info
@@ -159,6 +395,7 @@ class TableOperationsService:
     def get_non_vector_columns(self, table_name: str) -> List[str]:
         """
         Get list of non-vector columns in a table.
+        Vectors are detected from the Arrow schema, so no rows are read.
         
         Args:
             table_name: Table to analyze
@@ -166,16 +403,42 @@ class TableOperationsService:
         Returns:
             List of column names
         """
-        schema_result = self.get_table_schema(table_name)
-        if not isinstance(schema_result, dict) or 'data' not in schema_result:
-            logger.error(f"Unexpected schema result: {schema_result}")
-            return []
+        validate_table_name(table_name)
+        
+        table = self.db_service.get_connection()[table_name]
+        return get_display_columns(table.schema)
+    
+    @with_error_handling()
+    def describe_table(self, table_name: str, preview_limit: int = 10) -> Dict[str, Any]:
+        """
+        Get schema, preview rows and queryable columns of a table in one pass.
+        
+        Args:
+            table_name: Table to describe
+            preview_limit: Number of preview rows
             
-        schema = schema_result['data']
-        return [
-            name for name, info in schema.items()
-            if not info.get('is_vector', False)
-        ]
+        Returns:
+            Dictionary with schema, preview data, non-vector and filterable
+            columns, row count and the table version they were read at
+        """
+        validate_table_name(table_name)
+        
+        table = self.db_service.get_connection()[table_name]
+        non_vector_columns = get_display_columns(table.schema)
+        preview = table.search() \
+                       .select(non_vector_columns) \
+                       .limit(preview_limit) \
+                       .to_arrow()
+        
+        return {
+            'schema': self._build_schema_info(table.schema),
+            'preview': preview,
+            'preview_limit': preview_limit,
+            'non_vector_columns': non_vector_columns,
+            'filterable_columns': get_filterable_columns(table.schema),
+            'row_count': table.count_rows(),
+            'version': table.version
+        }
     
     @with_error_handling()
     def create_sample_table(self, table_name: str, columns: List[str],
@@ -193,24 +456,31 @@ class TableOperationsService:
         """
         validate_table_name(table_name)
         
-        # Generate sample data
+        # Generate sample data, one array per column
+        idx = np.arange(1, sample_size + 1)
+        # Fixed-size float32 vectors, shared by all embedding columns
+        embeddings = pa.FixedSizeListArray.from_arrays(
+            np.tile(np.array([0.1, 0.2, 0.3], dtype=np.float32), sample_size), 3
+        )
         sample_data = {}
         for col in columns:
+            match = _SAMPLE_COLUMN_KIND.match(col)
+            kind = match.lastgroup if match else None
             if col.lower() == 'id':
-                sample_data[col] = list(range(1, sample_size + 1))
-            elif any(kw in col.lower() for kw in ['embedding', 'vector']):
-                sample_data[col] = [[0.1, 0.2, 0.3]] * sample_size
-            elif any(kw in col.lower() for kw in ['int', 'num', 'count']):
-                sample_data[col] = [i * 10 for i in range(1, sample_size + 1)]
-            elif any(kw in col.lower() for kw in ['float', 'decimal', 'price']):
-                sample_data[col] = [i * 10.5 for i in range(1, sample_size + 1)]
+                sample_data[col] = idx
+            elif kind == 'embedding':
+                sample_data[col] = embeddings
+            elif kind == 'int':
+                sample_data[col] = idx * 10
+            elif kind == 'float':
+                sample_data[col] = idx * 10.5
             else:
-                sample_data[col] = [f"Sample {col} {i}" for i in range(1, sample_size + 1)]
+                sample_data[col] = [f"Sample {col} {i}" for i in idx]
         
-        df = pd.DataFrame(sample_data)
+        data = pa.table(sample_data)
         
         # Create the table
-        return self.create_table(table_name, df)
+        return self.create_table(table_name, data)
     
     @with_error_handling()
     def create_embeddings(self, table_name: str, selected_fields: List[str], 
@@ -239,7 +509,8 @@ class TableOperationsService:
         
         # Get the table data
         table = self.db_service.get_connection()[table_name]
-        df = pd.DataFrame(table.to_pandas())
+        data = table.to_arrow()
+        df = data.to_pandas()
         
         if not all(field in df.columns for field in selected_fields):
             missing = [f for f in selected_fields if f not in df.columns]
@@ -257,8 +528,14 @@ class TableOperationsService:
         # Generate embeddings
         embeddings = self.embedding_service.generate_batch_embeddings(texts, model_name)
         
-        # Add embeddings to the table
-        df[embedding_column] = embeddings
+        # Store fixed-size float32 vectors, which LanceDB can index
+        dimension = self.embedding_service.get_embedding_dimension(model_name)
+        vectors = pa.FixedSizeListArray.from_arrays(
+            np.asarray(embeddings, dtype=np.float32).reshape(-1), dimension
+        )
+        if embedding_column in data.column_names:
+            data = data.drop_columns([embedding_column])
+        data = data.append_column(embedding_column, vectors)
         
         # Delete the existing table first
         self.db_service.delete_table(table_name)
@@ -266,7 +543,7 @@ class TableOperationsService:
         # Create new table with embeddings
         self.db_service.create_table(
             table_name=table_name,
-            data=df,
+            data=data,
             vector_column=embedding_column
         )
         
@@ -279,13 +556,18 @@ class TableOperationsService:
         }
 
     @with_error_handling()
-    def delete_rows(self, table_name: str, filter_condition: Dict[str, Any]) -> Dict[str, Any]:
+    def delete_rows(self, table_name: str,
+                    filter_condition: Union[Dict[str, Any], List[Dict[str, Any]]]) -> Dict[str, Any]:
         """
-        Delete rows from a table based on a filter condition.
+        Delete rows from a table based on one or more filter conditions.
+        
+        All conditions are combined into a single filter that LanceDB applies
+        in place, so the table is neither read into memory nor rewritten.
         
         Args:
             table_name: Name of the table
-            filter_condition: Dictionary of column-value pairs to filter by
+            filter_condition: Dictionary of column-value pairs to filter by,
+                              or a list of them to delete rows matching any
             
         Returns:
             Dictionary with operation results
@@ -295,91 +577,85 @@ class TableOperationsService:
         """
         validate_table_name(table_name)
         
-        # Get the table data
-        table = self.db_service.get_connection()[table_name]
-        df = pd.DataFrame(table.to_pandas())
-        initial_row_count = len(df)
+        if isinstance(filter_condition, dict):
+            filter_condition = [filter_condition]
         
-        # Get schema to identify vector columns
-        schema = self.get_table_schema(table_name)
-        if not isinstance(schema, dict) or 'data' not in schema:
-            raise ValidationError("Failed to get table schema")
-            
-        vector_columns = [
-            name for name, info in schema['data'].items()
-            if info.get('is_vector', False)
-        ]
-        
-        # Remove vector columns from filter condition
-        for col in vector_columns:
-            filter_condition.pop(col, None)
-        
-        # Create filter mask
-        mask = pd.Series(True, index=df.index)
-        for column, value in filter_condition.items():
-            if column not in df.columns:
-                raise ValidationError(
-                    f"Column '{column}' not found in table",
-                    {'available_columns': list(df.columns)}
-                )
-            
-            # Convert value to match column type
-            try:
-                col_type = df[column].dtype
-                if pd.api.types.is_numeric_dtype(col_type):
-                    value = float(value) if isinstance(value, (int, float)) else value
-                elif pd.api.types.is_bool_dtype(col_type):
-                    value = bool(value)
-                elif pd.api.types.is_datetime64_dtype(col_type):
-                    value = pd.to_datetime(value)
-                
-                # Compare values
-                if pd.api.types.is_numeric_dtype(col_type):
-                    mask &= (df[column].astype(float) == float(value))
-                else:
-                    mask &= (df[column].astype(str) == str(value))
-                
-            except Exception as e:
-                raise ValidationError(f"Error comparing column {column}: {str(e)}")
-        
-        # Count rows to be deleted
-        rows_to_delete = mask.sum()
-        
-        if rows_to_delete == 0:
-            return {
-                'table_name': table_name,
-                'rows_deleted': 0,
-                'remaining_rows': initial_row_count,
-                'warning': 'No rows matched the filter condition'
+        schema = self.db_service.get_connection()[table_name].schema
+        
+        # Only scalar columns can be compared with SQL literals; vectors,
+        # other lists, structs and binary values are never used for matching
+        skipped_columns = {
+            field.name for field in schema if not is_filterable_field(field)
+        }
+        
+        # A row is deleted if any condition matches it
+        clauses = []
+        for condition in filter_condition:
+            condition = {
+                column: value for column, value in condition.items()
+                if column not in skipped_columns
             }
+            if not condition:
+                raise ValidationError("Filter condition has no columns to match on")
+            clauses.append(f"({self._build_row_filter(schema, condition)})")
         
-        # Filter out rows to keep
-        df = df[~mask]
+        initial_row_count = self.db_service.count_table_rows(table_name)
+        self.db_service.delete_rows(table_name, " OR ".join(clauses))
+        remaining_rows = self.db_service.count_table_rows(table_name)
         
-        # Verify we actually removed rows
-        if len(df) >= initial_row_count:
+        if remaining_rows == initial_row_count:
             return {
                 'table_name': table_name,
                 'rows_deleted': 0,
                 'remaining_rows': initial_row_count,
-                'error': 'No rows were removed after filtering'
+                'warning': 'No rows matched the filter condition'
             }
         
-        # Replace the table with filtered data
-        try:
-            self.db_service.replace_table(table_name, df)
-        except Exception as e:
-            raise
-        
         return {
             'table_name': table_name,
-            'rows_deleted': initial_row_count - len(df),
-            'remaining_rows': len(df)
+            'rows_deleted': initial_row_count - remaining_rows,
+            'remaining_rows': remaining_rows
         }
 
+    def _build_row_filter(self, schema: pa.Schema, condition: Dict[str, Any]) -> str:
+        """
+        Build a LanceDB SQL filter matching all column-value pairs of a condition.
+        
+        Args:
+            schema: Schema of the table
+            condition: Dictionary of column-value pairs to match
+            
+        Returns:
+            SQL filter string
+            
+        Raises:
+            ValidationError: If a column is missing or a value can't be compared
+        """
+        clauses = []
+        for column, value in condition.items():
+            if column not in schema.names:
+                raise ValidationError(
+                    f"Column '{column}' not found in table",
+                    {'available_columns': schema.names}
+                )
+            
+            field = schema.field(column)
+            if value is None:
+                clauses.append(f"{self._quote_identifier(column)} IS NULL")
+            elif isinstance(value, float) and math.isnan(value):
+                # NaN is not NULL and never equals itself
+                clauses.append(f"isnan({self._quote_identifier(column)})")
+            elif pa.types.is_boolean(field.type):
+                clauses.append(f"{self._quote_identifier(column)} = {'TRUE' if value else 'FALSE'}")
+            else:
+                clauses.append(self._build_filter(field, 'equals', value))
+        return " AND ".join(clauses)
+
     @with_error_handling()
     def get_table_data_paginated(self, table_name: str, page: int = 1, 
-                               page_size: int = 50) -> Dict[str, Any]:
+                               page_size: int = 50,
+                               batch_size: Optional[int] = None,
+                               total_rows: Optional[int] = None) -> Dict[str, Any]:
         """
         Get paginated table data.
         
@@ -387,6 +663,9 @@ class TableOperationsService:
             table_name: Table to query
             page: Page number (1-based)
             page_size: Number of rows per page
+            batch_size: If set, the page is streamed as a RecordBatchReader
+                        with batches of this size instead of an Arrow table
+            total_rows: Known row count of the table, counted if None
             
         Returns:
             Dictionary with paginated data and metadata
@@ -394,17 +673,25 @@ class TableOperationsService:
         validate_table_name(table_name)
         
         offset = (page - 1) * page_size
-        df = self.db_service.query_table_paginated(table_name, offset, page_size)
+        table = self.db_service.get_connection()[table_name]
+        columns = get_display_columns(table.schema)
+        if batch_size:
+            data = self.db_service.iter_table_batches(
+                table_name, offset, page_size, columns, batch_size
+            )
+        else:
+            data = self.db_service.query_table_arrow(table_name, offset, page_size, columns)
         
         # Get total rows and handle the wrapped response
-        total_rows_result = self.get_table_row_count(table_name)
-        if isinstance(total_rows_result, dict) and 'data' in total_rows_result:
-            total_rows = total_rows_result['data']
-        else:
-            total_rows = total_rows_result
+        if total_rows is None:
+            total_rows_result = self.get_table_row_count(table_name)
+            if isinstance(total_rows_result, dict) and 'data' in total_rows_result:
+                total_rows = total_rows_result['data']
+            else:
+                total_rows = total_rows_result
         
         return {
-            'data': df,
+            'data': data,
             'current_page': page,
             'page_size': page_size,
             'total_rows': total_rows,
@@ -425,4 +712,18 @@ class TableOperationsService:
             Total number of rows
         """
         validate_table_name(table_name)
-        return self.db_service.count_table_rows(table_name) 
\ No newline at end of file
+        return self.db_service.count_table_rows(table_name)
+
+    @with_error_handling()
+    def get_table_version(self, table_name: str) -> int:
+        """
+        Get the current version of a table.
+        
+        Args:
+            table_name: Table to inspect
+            
+        Returns:
+            Table version number
+        """
+        validate_table_name(table_name)
+        return self.db_service.get_table_version(table_name) 
\ No newline at end of file
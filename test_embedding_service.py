@@ -0,0 +1,112 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from services import embedding_service
+from services.embedding_service import EmbeddingError, _EmbeddingBatcher
+
+
+class WorkerKilled(BaseException):
+    pass
+
+
+class FakeModel:
+    """Embeds a text as [len(text)] and records each encode call."""
+
+    def __init__(self):
+        self.calls = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def encode(self, texts, batch_size, convert_to_numpy):
+        self.calls.append(list(texts))
+        if 'block' in texts:
+            self.release.wait(5)
+        if 'bad' in texts:
+            raise ValueError('bad input')
+        if 'kill' in texts:
+            raise WorkerKilled()
+        return np.array([[float(len(text))] for text in texts])
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'timed out'
+        time.sleep(0.005)
+
+
+def encode_while_blocked(batcher, model, texts):
+    """Queue texts behind a blocked encode call so they form one batch."""
+    model.release.clear()
+    results = {}
+
+    def encode(text):
+        try:
+            results[text] = batcher.encode(text, 'fake')
+        except Exception as e:
+            results[text] = e
+
+    blocker = threading.Thread(target=encode, args=('block',))
+    blocker.start()
+    wait_until(lambda: model.calls)
+    threads = [threading.Thread(target=encode, args=(text,)) for text in texts]
+    for thread in threads:
+        thread.start()
+    wait_until(lambda: len(batcher._pending) == len(texts))
+    model.release.set()
+    for thread in [blocker] + threads:
+        thread.join(5)
+    return results
+
+
+@pytest.fixture
+def model():
+    return FakeModel()
+
+
+@pytest.fixture
+def batcher(model):
+    return _EmbeddingBatcher(lambda model_name: model)
+
+
+class TestEmbeddingBatcher:
+
+    # Requests made at the same time share one encode call
+    def test_coalesces_concurrent_requests(self, batcher, model):
+        texts = ['a', 'bb', 'ccc', 'dddd']
+
+        results = encode_while_blocked(batcher, model, texts)
+
+        assert model.calls[1:] == [texts]
+        for text in texts:
+            assert results[text].tolist() == [float(len(text))]
+
+    # A bad input only fails its own request
+    def test_isolates_failing_input(self, batcher, model):
+        results = encode_while_blocked(batcher, model, ['ok', 'bad', 'fine'])
+
+        assert isinstance(results['bad'], ValueError)
+        assert results['ok'].tolist() == [2.0]
+        assert results['fine'].tolist() == [4.0]
+
+    # The worker exits when idle and a later request starts a new one
+    def test_worker_exits_when_idle(self, batcher, monkeypatch):
+        monkeypatch.setattr(embedding_service, '_WORKER_IDLE_SECONDS', 0.05)
+
+        batcher.encode('a', 'fake')
+        wait_until(lambda: batcher._worker is None)
+
+        assert batcher.encode('bb', 'fake').tolist() == [2.0]
+
+    # A worker killed by a non-Exception error fails its requests instead of hanging them
+    def test_dead_worker_fails_requests_and_restarts(self, batcher, monkeypatch):
+        monkeypatch.setattr(threading, 'excepthook', lambda args: None)
+
+        with pytest.raises(EmbeddingError):
+            batcher.encode('kill', 'fake')
+        wait_until(lambda: batcher._worker is None)
+
+        assert batcher.encode('a', 'fake').tolist() == [1.0]
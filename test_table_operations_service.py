@@ -0,0 +1,172 @@
+import datetime
+import decimal
+import math
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from streamlit import dataframe_util
+
+from adapters.streamlit_adapter import _selected_rows
+from services.lancedb_service import LanceDBService, InvalidFilterError
+from services.table_operations_service import TableOperationsService
+from utils.schema_utils import get_display_columns
+
+
+@pytest.fixture
+def table_ops(tmp_path):
+    db_service = LanceDBService()
+    db_service.connect(str(tmp_path))
+    db_service.get_connection().create_table('items', pa.table({
+        'id': [1, 2, 3],
+        'score': [math.nan, 1.5, 2.5],
+        'tags': [['a'], ['b', 'c'], []],
+        'embedding': pa.FixedSizeListArray.from_arrays(
+            pa.array(np.zeros(9, dtype=np.float32)), 3
+        )
+    }))
+    return TableOperationsService(db_service)
+
+
+def edit_selection(preview, selected):
+    """Tick rows in a Select column and return it the way st.data_editor does."""
+    editor_data = preview.add_column(0, 'Select', pa.array([False] * preview.num_rows))
+    df = dataframe_util.convert_anything_to_pandas_df(editor_data)
+    df['Select'] = [i in selected for i in range(len(df))]
+    return dataframe_util.convert_pandas_df_to_data_format(
+        df, dataframe_util.determine_data_format(editor_data)
+    )
+
+
+class TestDeleteRows:
+
+    # Rows read back from the table are deleted despite their list columns
+    def test_deletes_rows_with_list_and_nan_values(self, table_ops):
+        rows = table_ops.db_service.get_connection()['items'].to_arrow().to_pylist()
+
+        result = table_ops.delete_rows('items', [rows[0], rows[1]])
+
+        assert result['success'], result
+        assert result['data']['rows_deleted'] == 2
+        remaining = table_ops.db_service.get_connection()['items'].to_arrow()
+        assert remaining.column('id').to_pylist() == [3]
+
+    # A condition on non-scalar columns only has nothing to match on
+    def test_rejects_condition_without_scalar_columns(self, table_ops):
+        result = table_ops.delete_rows('items', {'tags': ['a'], 'embedding': [0.0, 0.0, 0.0]})
+
+        assert not result['success']
+        assert result['error']['type'] == 'ValidationError'
+
+    # Time and dictionary-encoded columns get typed literals
+    def test_deletes_rows_with_time_and_dictionary_values(self, table_ops):
+        connection = table_ops.db_service.get_connection()
+        connection.create_table('events', pa.table({
+            'at': pa.array([datetime.time(12, 0), datetime.time(13, 30, 5)], pa.time64('us')),
+            'kind': pa.array(['start', 'stop']).dictionary_encode()
+        }))
+        rows = connection['events'].to_arrow().to_pylist()
+
+        result = table_ops.delete_rows('events', rows[0])
+
+        assert result['success'], result
+        assert result['data']['rows_deleted'] == 1
+
+    # Rows selected in the preview editor are deleted with their original types
+    def test_deletes_rows_selected_in_editor(self, table_ops):
+        connection = table_ops.db_service.get_connection()
+        connection.create_table('readings', pa.table({
+            'n': pa.array([5, None, 7], pa.int64()),
+            'value': [math.nan, 1.5, 2.5],
+            'tags': [['a'], ['b'], []]
+        }))
+        table = connection['readings']
+        preview = table.search().select(get_display_columns(table.schema)).to_arrow()
+
+        edited = edit_selection(preview, {0, 1})
+        # The editor's copy no longer has the table's types
+        assert edited.schema.field('n').type != pa.int64()
+
+        rows = _selected_rows(preview, edited).to_pylist()
+        result = table_ops.delete_rows('readings', rows)
+
+        assert result['success'], result
+        assert result['data']['rows_deleted'] == 2
+        assert connection['readings'].to_arrow().column('n').to_pylist() == [7]
+
+
+@pytest.fixture
+def typed_ops(tmp_path):
+    db_service = LanceDBService()
+    db_service.connect(str(tmp_path))
+    utc = datetime.timezone.utc
+    db_service.get_connection().create_table('typed', pa.table({
+        'id': [1, 2, 3],
+        'flag': [True, False, True],
+        'amount': pa.array(
+            [decimal.Decimal('1.50'), decimal.Decimal('2.25'), decimal.Decimal('3.00')],
+            pa.decimal128(10, 2)
+        ),
+        'day': [datetime.date(2024, 1, 1), datetime.date(2024, 6, 1), datetime.date(2025, 1, 1)],
+        'at': pa.array([
+            datetime.datetime(2024, 1, 1, 12), datetime.datetime(2024, 6, 1),
+            datetime.datetime(2025, 1, 1)
+        ], pa.timestamp('us')),
+        'at_utc': pa.array([
+            datetime.datetime(2024, 1, 1, 12, tzinfo=utc), datetime.datetime(2024, 6, 1, tzinfo=utc),
+            datetime.datetime(2025, 1, 1, tzinfo=utc)
+        ], pa.timestamp('us', tz='UTC')),
+        'ratio': [0.5, math.inf, -math.inf],
+        'label': ['50% off', '500 off', 'a_b']
+    }))
+    return TableOperationsService(db_service)
+
+
+def matching_ids(ops, column, operator, value):
+    result = ops.query_table('typed', column, operator, value)
+    assert result['success'], result
+    return sorted(result['data']['data'].column('id').to_pylist())
+
+
+class TestQueryFilters:
+
+    # Values are cast to the column's type before they reach LanceDB
+    @pytest.mark.parametrize('column, operator, value, expected', [
+        ('flag', 'equals', 'true', [1, 3]),
+        ('amount', 'greater than', '2.0', [2, 3]),
+        ('amount', 'equals', '1.5', [1]),
+        ('day', 'less than', '2024-03-01', [1]),
+        ('at', 'equals', '2024-01-01 12:00:00', [1]),
+        ('at_utc', 'equals', '2024-01-01T12:00:00+00:00', [1]),
+        ('at_utc', 'greater than', '2024-03-01 00:00:00Z', [2, 3]),
+        ('ratio', 'equals', 'inf', [2]),
+        ('ratio', 'less than', '0', [3]),
+    ])
+    def test_typed_literals(self, typed_ops, column, operator, value, expected):
+        assert matching_ids(typed_ops, column, operator, value) == expected
+
+    # 'contains' matches % and _ literally
+    @pytest.mark.parametrize('value, expected', [('50%', [1]), ('a_b', [3]), ('off', [1, 2])])
+    def test_contains_escapes_wildcards(self, typed_ops, value, expected):
+        assert matching_ids(typed_ops, 'label', 'contains', value) == expected
+
+    # NaN and values of the wrong type are rejected before querying
+    @pytest.mark.parametrize('column, value', [
+        ('ratio', 'nan'), ('id', '2.5'), ('flag', 'maybe'), ('day', 'soon'), ('amount', 'x')
+    ])
+    def test_rejects_invalid_values(self, typed_ops, column, value):
+        result = typed_ops.query_table('typed', column, 'equals', value)
+
+        assert not result['success']
+        assert result['error']['type'] == 'ValidationError'
+
+    # A filter LanceDB rejects fails at once instead of being retried
+    def test_rejected_filter_is_not_retried(self, typed_ops, monkeypatch):
+        delays = []
+        monkeypatch.setattr('services.lancedb_service.time.sleep', delays.append)
+
+        with pytest.raises(InvalidFilterError):
+            typed_ops.db_service.query_table_arrow('typed', where='((')
+
+        assert delays == []
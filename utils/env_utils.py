@@ -5,6 +5,7 @@ This module provides utility functions for detecting and handling
 environment-specific concerns that might be needed by different UI adapters.
 """
 import os
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 
@@ -24,10 +25,12 @@ def get_environment_variables() -> Dict[str, str]:
     return env_vars
 
 
+@lru_cache(maxsize=1)
 def is_running_in_docker() -> bool:
     """
     Check if the application is running inside a Docker container.
     This is moved to a utility function so it can be used by any UI adapter.
+    The answer can't change while the process runs, so it is computed once.
     
     Returns:
         True if running in Docker, False otherwise
@@ -39,7 +42,8 @@ def is_running_in_docker() -> bool:
             
         # Secondary method: check cgroups
         with open('/proc/self/cgroup', 'r') as f:
-            return any('docker' in line for line in f)
+            cgroup = f.read()
+        return 'docker' in cgroup or 'kubepods' in cgroup
     except:
         # Fallback to environment variable check
         return os.environ.get('RUNNING_IN_DOCKER', 'false').lower() == 'true'
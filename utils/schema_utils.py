@@ -0,0 +1,103 @@
+"""
+Schema Utilities Module
+
+This module provides helpers for inspecting Arrow schemas of LanceDB tables,
+independent of any UI framework.
+"""
+from typing import List
+import re
+import pyarrow as pa
+
+# Field names that suggest an embedding column
+_EMBEDDING_NAME = re.compile(r"embedding|vector", re.IGNORECASE)
+
+
+def is_vector_field(field: pa.Field) -> bool:
+    """
+    Check whether a schema field holds vectors (lists of floats).
+    
+    Args:
+        field: Arrow schema field
+        
+    Returns:
+        True if the field is a vector/embedding column
+    """
+    field_type = field.type
+    is_list = (
+        pa.types.is_fixed_size_list(field_type) or
+        pa.types.is_list(field_type) or
+        pa.types.is_large_list(field_type)
+    )
+    return is_list and pa.types.is_floating(field_type.value_type)
+
+
+def is_filterable_field(field: pa.Field) -> bool:
+    """
+    Check whether a column can be compared with a literal in a SQL filter.
+    Nested (lists, structs, maps), binary and other non-scalar types can't.
+    
+    Args:
+        field: Arrow schema field
+        
+    Returns:
+        True if the field can be filtered on
+    """
+    field_type = field.type
+    return (
+        pa.types.is_string(field_type) or
+        pa.types.is_large_string(field_type) or
+        pa.types.is_integer(field_type) or
+        pa.types.is_floating(field_type) or
+        pa.types.is_decimal(field_type) or
+        pa.types.is_boolean(field_type) or
+        pa.types.is_date(field_type) or
+        pa.types.is_timestamp(field_type) or
+        pa.types.is_time(field_type) or
+        (pa.types.is_dictionary(field_type) and (
+            pa.types.is_string(field_type.value_type) or
+            pa.types.is_large_string(field_type.value_type)
+        ))
+    )
+
+
+def get_filterable_columns(schema: pa.Schema) -> List[str]:
+    """
+    Get the columns of a schema that can be used in a filter.
+    
+    Args:
+        schema: Arrow schema
+        
+    Returns:
+        List of column names
+    """
+    return [field.name for field in schema if is_filterable_field(field)]
+
+
+def get_display_columns(schema: pa.Schema) -> List[str]:
+    """
+    Get the columns of a schema that are worth displaying (no vectors).
+    
+    Args:
+        schema: Arrow schema
+        
+    Returns:
+        List of column names
+    """
+    return [field.name for field in schema if not is_vector_field(field)]
+
+
+def get_vector_columns(schema: pa.Schema) -> List[str]:
+    """
+    Get the vector columns of a schema, most likely embeddings first.
+    
+    Only the type decides what is a vector; columns named like embeddings
+    are just ranked ahead of the other vector columns.
+    
+    Args:
+        schema: Arrow schema
+        
+    Returns:
+        List of column names
+    """
+    vector_columns = [field.name for field in schema if is_vector_field(field)]
+    return sorted(vector_columns, key=lambda name: _EMBEDDING_NAME.search(name) is None)